@@ -8,6 +8,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from server.routers.check_claim import router as check_claim_router
+from server.routers.metrics import router as metrics_router
 from server.routers.oracles import router as oracles_router
 
 app = FastAPI(
@@ -28,6 +29,7 @@ app.add_middleware(
 # Include routers
 app.include_router(check_claim_router)
 app.include_router(oracles_router)
+app.include_router(metrics_router)
 
 
 @app.get("/")
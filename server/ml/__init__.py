@@ -2,9 +2,25 @@
 Machine Learning module for GroundZero
 
 Contains ML models and utilities for content analysis and recommendations.
+
+Exports are resolved lazily (PEP 562) so importing ``server.ml`` does not pull in
+the ML dependencies until one of them is actually used.
 """
 
-from server.ml.claim_extractor import ClaimExtractor, extract_claim
-from server.ml.domain_classifier import DomainClassifier, classify_domain
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "ClaimExtractor": "server.ml.claim_extractor",
+    "extract_claim": "server.ml.claim_extractor",
+    "DomainClassifier": "server.ml.domain_classifier",
+    "classify_domain": "server.ml.domain_classifier",
+}
 
 __all__ = ["ClaimExtractor", "extract_claim", "DomainClassifier", "classify_domain"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name), name)
@@ -23,6 +23,70 @@ PRICE_MOVEMENT_KEYWORDS = [
 ]
 TECH_RELEASE_KEYWORDS = ["announced", "released", "launched", "introduced"]
 
+# Filter out common words that aren't tickers (simple heuristic)
+# This is a simple approach; a more sophisticated one would use a ticker database
+_COMMON_WORDS = frozenset({"I", "A", "IT", "US", "UK", "AI", "ML", "API", "CEO", "CTO", "CFO"})
+
+# Filter out common tech acronyms that are unlikely to be tickers
+_FALSE_POSITIVE_ACRONYMS = frozenset(
+    {"GPU", "CPU", "RAM", "SSD", "HTTP", "HTTPS", "HTML", "CSS", "JSON", "SQL", "RL", "SDK"}
+)
+
+_NON_TICKERS = _COMMON_WORDS | _FALSE_POSITIVE_ACRONYMS
+
+# Precompiled patterns (compiled once at import instead of on every call)
+# Match 1-5 uppercase letters that are standalone words
+_TICKER_RE = re.compile(r"\b[A-Z]{1,5}\b")
+
+# Bounded quantifiers to prevent ReDoS: optional +/-, optional whitespace (max 5),
+# optional "up/down", number, %
+_PCT_RE = re.compile(
+    r"[+\-]?\s{0,5}(?:up\s+|down\s+)?(\d{1,5}(?:\.\d{1,2})?)\s{0,5}%", re.IGNORECASE
+)
+
+# Date hints in priority order: when a text contains several, the earliest listed wins
+DATE_HINTS = [
+    "today",
+    "yesterday",
+    "this morning",
+    "this afternoon",
+    "this evening",
+    "last week",
+    "last month",
+    "last year",
+    "this week",
+    "this month",
+    "this year",
+]
+_DATE_HINT_RANK = {hint: rank for rank, hint in enumerate(DATE_HINTS)}
+
+# Single alternation so all date hints are found in one scan; the best ranked match
+# is then picked, so the result does not depend on where each hint appears
+_DATE_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, DATE_HINTS)) + r")\b")
+
+# All lowercased company names in one alternation, run over the lowercased text and
+# mapped back to canonical case
+_COMPANY_BY_LOWER = {company.lower(): company for company in KNOWN_COMPANIES}
+_COMPANY_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, _COMPANY_BY_LOWER)) + r")\b")
+
+# Event keywords are plain lowercase words with no regex metacharacters, so they
+# can be joined into the pattern as-is without re.escape
+assert all(
+    re.fullmatch(r"[a-z]+", keyword) for keyword in PRICE_MOVEMENT_KEYWORDS + TECH_RELEASE_KEYWORDS
+)
+
+# Plain substrings for a cheap prefilter before the boundary-aware regex
+_EVENT_KEYWORDS = tuple(PRICE_MOVEMENT_KEYWORDS + TECH_RELEASE_KEYWORDS)
+
+# Both event keyword sets in one tagged alternation; match.lastgroup names the category
+_EVENT_RE = re.compile(
+    r"\b(?:(?P<price>"
+    + "|".join(PRICE_MOVEMENT_KEYWORDS)
+    + r")|(?P<tech>"
+    + "|".join(TECH_RELEASE_KEYWORDS)
+    + r"))\b"
+)
+
 
 class ClaimExtractor:
     """Extracts structured claim information from raw text."""
@@ -40,66 +104,36 @@ class ClaimExtractor:
         Returns:
             List of extracted ticker symbols
         """
-        # Match 1-5 uppercase letters that are standalone words
-        # Use word boundaries to avoid matching parts of regular words
-        pattern = r"\b[A-Z]{1,5}\b"
-        matches = re.findall(pattern, text)
-
-        # Filter out common words that aren't tickers (simple heuristic)
-        # Keep only if they look like tickers (typically 2-5 chars)
-        # This is a simple approach; a more sophisticated one would use a ticker database
-        common_words = {"I", "A", "IT", "US", "UK", "AI", "ML", "API", "CEO", "CTO", "CFO"}
-
-        # Filter out common tech acronyms that are unlikely to be tickers
-        false_positive_acronyms = {
-            "GPU",
-            "CPU",
-            "RAM",
-            "SSD",
-            "HTTP",
-            "HTTPS",
-            "HTML",
-            "CSS",
-            "JSON",
-            "SQL",
-            "RL",
-            "SDK",
-        }
-
-        tickers = [
-            m
-            for m in matches
-            if m not in common_words and m not in false_positive_acronyms and len(m) >= 2
-        ]
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_tickers = []
-        for ticker in tickers:
-            if ticker not in seen:
-                seen.add(ticker)
-                unique_tickers.append(ticker)
-
-        return unique_tickers
+        matches = _TICKER_RE.findall(text)
+
+        # Keep only if they look like tickers (typically 2-5 chars), and remove
+        # duplicates while preserving order
+        return list(dict.fromkeys(m for m in matches if len(m) >= 2 and m not in _NON_TICKERS))
 
     @staticmethod
-    def extract_companies(text: str) -> list[str]:
+    def extract_companies(text: str, text_lower: Optional[str] = None) -> list[str]:
         """
         Extract known company names from text.
 
         Args:
             text: The input text to extract companies from
+            text_lower: Pre-lowercased copy of text, computed if not provided
 
         Returns:
             List of matched company names
         """
-        found_companies = []
-        for company in KNOWN_COMPANIES:
-            # Case-insensitive search for company name
-            if re.search(r"\b" + re.escape(company) + r"\b", text, re.IGNORECASE):
-                found_companies.append(company)
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # Cheap substring prefilter: most claims mention none of the known companies,
+        # so skip the case-insensitive regex unless a name appears somewhere
+        if not any(name in text_lower for name in _COMPANY_BY_LOWER):
+            return []
 
-        return found_companies
+        # Single scan for all companies; dedupe while preserving order of appearance
+        return list(
+            dict.fromkeys(_COMPANY_BY_LOWER[match] for match in _COMPANY_RE.findall(text_lower))
+        )
 
     @staticmethod
     def extract_percentages(text: str) -> list[float]:
@@ -114,22 +148,11 @@ class ClaimExtractor:
         Returns:
             List of percentage values as floats
         """
-        # Pattern with bounded quantifiers to prevent ReDoS
-        # Matches optional +/-, optional whitespace (max 5), optional "up/down", number, %
-        pattern = r"[+\-]?\s{0,5}(?:up\s+|down\s+)?(\d{1,5}(?:\.\d{1,2})?)\s{0,5}%"
-        matches = re.findall(pattern, text, re.IGNORECASE)
-
-        percentages = []
-        for match in matches:
-            try:
-                percentages.append(float(match))
-            except ValueError:
-                continue
-
-        return percentages
+        # The captured group is always a well-formed decimal, so float() cannot fail
+        return [float(match.group(1)) for match in _PCT_RE.finditer(text)]
 
     @staticmethod
-    def extract_date_hint(text: str) -> Optional[str]:
+    def extract_date_hint(text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """
         Extract date hints from text.
 
@@ -137,56 +160,54 @@ class ClaimExtractor:
 
         Args:
             text: The input text to extract date hints from
+            text_lower: Pre-lowercased copy of text, computed if not provided
 
         Returns:
-            First matched date hint or None
+            Matched date hint that comes first in DATE_HINTS, or None
         """
-        date_patterns = [
-            r"\btoday\b",
-            r"\byesterday\b",
-            r"\bthis morning\b",
-            r"\bthis afternoon\b",
-            r"\bthis evening\b",
-            r"\blast week\b",
-            r"\blast month\b",
-            r"\blast year\b",
-            r"\bthis week\b",
-            r"\bthis month\b",
-            r"\bthis year\b",
-        ]
-
-        text_lower = text.lower()
-        for pattern in date_patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                return match.group(0)
-
-        return None
+        if text_lower is None:
+            text_lower = text.lower()
+
+        best_hint = None
+        for match in _DATE_RE.finditer(text_lower):
+            hint = match.group(0)
+            if best_hint is None or _DATE_HINT_RANK[hint] < _DATE_HINT_RANK[best_hint]:
+                best_hint = hint
+                # Nothing outranks the first hint, so stop scanning
+                if _DATE_HINT_RANK[hint] == 0:
+                    break
+
+        return best_hint
 
     @staticmethod
-    def determine_event_type(text: str) -> Optional[str]:
+    def determine_event_type(text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """
         Determine the event type based on keywords in the text.
 
         Args:
             text: The input text to analyze
+            text_lower: Pre-lowercased copy of text, computed if not provided
 
         Returns:
             Event type: "price_movement", "tech_release", or None
         """
-        text_lower = text.lower()
-
-        # Check for price movement keywords
-        for keyword in PRICE_MOVEMENT_KEYWORDS:
-            if re.search(r"\b" + re.escape(keyword) + r"\b", text_lower):
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # Substring checks are much cheaper than the regex on a miss, and most claims
+        # contain none of the keywords; the regex still enforces word boundaries
+        if not any(keyword in text_lower for keyword in _EVENT_KEYWORDS):
+            return None
+
+        # Price movement keywords take precedence over tech release keywords wherever
+        # they appear, so stop at the first price match and only remember tech matches
+        has_tech_keyword = False
+        for match in _EVENT_RE.finditer(text_lower):
+            if match.lastgroup == "price":
                 return "price_movement"
+            has_tech_keyword = True
 
-        # Check for tech release keywords
-        for keyword in TECH_RELEASE_KEYWORDS:
-            if re.search(r"\b" + re.escape(keyword) + r"\b", text_lower):
-                return "tech_release"
-
-        return None
+        return "tech_release" if has_tech_keyword else None
 
 
 def extract_claim(raw_text: str) -> Claim:
@@ -199,13 +220,25 @@ def extract_claim(raw_text: str) -> Claim:
     Returns:
         Claim object with extracted information
     """
+    # Nothing extractable fits in fewer than two characters
+    if len(raw_text) < 2:
+        return Claim(raw=raw_text)
+
     extractor = ClaimExtractor()
 
+    # Lowercase once and share it across the case-insensitive extractors
+    text_lower = raw_text.lower()
+
+    # Cheap prefilters: tickers need an uppercase letter and percentages need a "%",
+    # so skip those regex scans entirely when the text cannot match
+    has_upper = text_lower != raw_text
+    has_percent = "%" in raw_text
+
     return Claim(
         raw=raw_text,
-        tickers=extractor.extract_tickers(raw_text),
-        companies=extractor.extract_companies(raw_text),
-        percentages=extractor.extract_percentages(raw_text),
-        date_hint=extractor.extract_date_hint(raw_text),
-        event_type=extractor.determine_event_type(raw_text),
+        tickers=extractor.extract_tickers(raw_text) if has_upper else [],
+        companies=extractor.extract_companies(raw_text, text_lower),
+        percentages=extractor.extract_percentages(raw_text) if has_percent else [],
+        date_hint=extractor.extract_date_hint(raw_text, text_lower),
+        event_type=extractor.determine_event_type(raw_text, text_lower),
     )
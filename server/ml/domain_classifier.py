@@ -2,10 +2,12 @@
 Domain classification module for categorizing claims into domains.
 """
 
+import re
+import threading
+from functools import lru_cache
 from typing import Optional
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
 
 from server.schemas.claim import Claim, DomainResult
 
@@ -32,6 +34,15 @@ GENERAL_ANCHORS = [
     "general question or unrelated concept",
 ]
 
+# Domains in anchor order; each domain's anchors are contiguous rows of the anchor matrix
+_DOMAIN_LABELS = ("finance", "tech_release", "general")
+_DOMAIN_OFFSETS = np.array(
+    [0, len(FINANCE_ANCHORS), len(FINANCE_ANCHORS) + len(TECH_RELEASE_ANCHORS)], dtype=np.intp
+)
+
+# Same token pattern as sklearn's default, so claim tokens line up with the fitted vocabulary
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
 
 class SemanticDomainClassifier:
     """Classifies claims into domains using semantic embeddings and cosine similarity."""
@@ -45,39 +56,84 @@ class SemanticDomainClassifier:
         """
         self.similarity_threshold = similarity_threshold
         self._vectorizer = None
-        self._anchor_vectors = None
-        self._domain_names = None
+        self._vocabulary = None
+        self._idf = None
+        self._stop_words = None
+        self._anchor_vectors_T = None
         self._anchors = None
+        self._init_lock = threading.Lock()
 
     def _init_model(self):
         """Initialize the TF-IDF vectorizer and anchor embeddings."""
-        if self._vectorizer is None:
-            # Prepare domain anchors
-            all_anchors = []
-            domain_labels = []
+        if self._vectorizer is not None:
+            return
 
-            for anchor in FINANCE_ANCHORS:
-                all_anchors.append(anchor)
-                domain_labels.append("finance")
+        # Requests classify in threadpool workers, so the first few may arrive together;
+        # fit under a lock and publish the vectorizer last, as it marks the model ready
+        with self._init_lock:
+            if self._vectorizer is not None:
+                return
 
-            for anchor in TECH_RELEASE_ANCHORS:
-                all_anchors.append(anchor)
-                domain_labels.append("tech_release")
+            # Imported lazily: sklearn adds noticeable import time and memory, and
+            # is only needed once the first claim is classified
+            from sklearn.feature_extraction.text import TfidfVectorizer
 
-            for anchor in GENERAL_ANCHORS:
-                all_anchors.append(anchor)
-                domain_labels.append("general")
+            # Prepare domain anchors, grouped by domain in _DOMAIN_LABELS order
+            all_anchors = FINANCE_ANCHORS + TECH_RELEASE_ANCHORS + GENERAL_ANCHORS
 
             # Initialize TF-IDF vectorizer
-            self._vectorizer = TfidfVectorizer(
+            vectorizer = TfidfVectorizer(
                 max_features=1000, ngram_range=(1, 2), stop_words="english"
             )
 
-            # Fit and transform anchors
-            self._anchor_vectors = self._vectorizer.fit_transform(all_anchors)
-            self._domain_names = domain_labels
+            # Fit and transform anchors. With only a handful of anchors a dense
+            # float32 matrix is smaller and faster to score against than sparse.
+            # Rows are L2-normalized by the vectorizer, so a dot product is the cosine.
+            # Stored transposed (vocabulary x anchors, C-contiguous) so the columns a
+            # claim touches are gathered as whole contiguous rows.
+            anchor_vectors = vectorizer.fit_transform(all_anchors).toarray()
+            self._anchor_vectors_T = np.ascontiguousarray(anchor_vectors.T, dtype=np.float32)
             self._anchors = all_anchors
 
+            # Export the fitted vocabulary and IDF weights so claims can be scored with
+            # plain dict lookups instead of going through sklearn on every request
+            self._vocabulary = dict(vectorizer.vocabulary_)
+            self._idf = vectorizer.idf_
+            self._stop_words = frozenset(vectorizer.get_stop_words())
+            self._vectorizer = vectorizer
+
+    def _vectorize(self, text: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the L2-normalized TF-IDF weights of a claim over the fitted vocabulary.
+
+        Mirrors the fitted vectorizer: lowercase, tokenize, drop stop words, then
+        count unigrams and bigrams that appear in the anchor vocabulary.
+
+        Args:
+            text: The claim text to vectorize
+
+        Returns:
+            Tuple of (vocabulary column indices, weights); both empty if no term matches
+        """
+        tokens = [t for t in _TOKEN_RE.findall(text.lower()) if t not in self._stop_words]
+        terms = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+        counts: dict[int, int] = {}
+        for term in terms:
+            column = self._vocabulary.get(term)
+            if column is not None:
+                counts[column] = counts.get(column, 0) + 1
+
+        columns = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+        weights = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        weights *= self._idf[columns]
+
+        norm = np.linalg.norm(weights)
+        if norm > 0:
+            weights /= norm
+
+        return columns, weights
+
     def classify(self, text: str, claim: Optional[Claim] = None) -> DomainResult:
         """
         Classify claim into a domain using semantic similarity.
@@ -93,22 +149,19 @@ class SemanticDomainClassifier:
         self._init_model()
 
         # Vectorize the input claim
-        claim_vector = self._vectorizer.transform([text])
+        columns, weights = self._vectorize(text)
 
-        # Compute cosine similarity with all anchors
-        similarities = cosine_similarity(claim_vector, self._anchor_vectors)[0]
+        # Cosine similarity with all anchors: both sides are unit-length, so only the
+        # claim's own terms contribute and one small matvec gives every similarity
+        similarities = weights @ self._anchor_vectors_T[columns]
 
-        # Group similarities by domain and find max for each
-        domain_scores = {}
-        for domain_name, similarity in zip(self._domain_names, similarities):
-            if domain_name not in domain_scores:
-                domain_scores[domain_name] = similarity
-            else:
-                domain_scores[domain_name] = max(domain_scores[domain_name], similarity)
+        # Max similarity per domain over its contiguous block of anchors
+        domain_scores = np.maximum.reduceat(similarities, _DOMAIN_OFFSETS)
 
         # Find domain with highest score
-        best_domain = max(domain_scores, key=domain_scores.get)
-        best_score = domain_scores[best_domain]
+        best_idx = int(domain_scores.argmax())
+        best_domain = _DOMAIN_LABELS[best_idx]
+        best_score = float(domain_scores[best_idx])
 
         # Apply threshold - if score is below threshold, default to general
         if best_score < self.similarity_threshold:
@@ -125,12 +178,24 @@ class SemanticDomainClassifier:
         return DomainResult(domain=domain, confidence=confidence)
 
 
+# Process-wide classifier, fit once on first use instead of on every request
+_semantic_classifier = SemanticDomainClassifier()
+
+
+@lru_cache(maxsize=2048)
+def _classify_cached(text: str) -> tuple[str, float]:
+    """Classify text with the shared classifier, memoized for repeated claim texts."""
+    result = _semantic_classifier.classify(text)
+    return result.domain, result.confidence
+
+
 class DomainClassifier:
     """Classifies claims into domains using semantic approach."""
 
     def __init__(self):
         """Initialize the domain classifier."""
-        self._semantic_classifier = SemanticDomainClassifier()
+        # Share the process-wide semantic classifier so the TF-IDF model is fit once
+        self._semantic_classifier = _semantic_classifier
 
     def classify(self, text: str, claim: Optional[Claim] = None) -> DomainResult:
         """
@@ -158,5 +223,6 @@ def classify_domain(text: str, claim: Optional[Claim] = None) -> DomainResult:
     Returns:
         DomainResult with domain and confidence
     """
-    classifier = DomainClassifier()
-    return classifier.classify(text, claim)
+    # The semantic path ignores `claim`, so the text alone is a sufficient cache key
+    domain, confidence = _classify_cached(text)
+    return DomainResult(domain=domain, confidence=confidence)
@@ -8,9 +8,6 @@ from server.schemas.aggregate_result import AggregateResult, OracleCallResult
 from server.schemas.claim import Claim, DomainResult
 from server.schemas.oracle_result import OracleResult
 
-# Rebuild model to resolve forward references
-AggregateResult.model_rebuild()
-
 
 def aggregate_oracle_results(
     oracle_results: list[OracleResult],
@@ -38,60 +35,70 @@ def aggregate_oracle_results(
     Returns:
         AggregateResult with final verdict and confidence
     """
-    # Convert OracleResult to OracleCallResult
-    oracle_calls = [
-        OracleCallResult(
-            oracle_name=result.oracle_name,
-            verdict=result.verdict,
-            confidence=result.confidence,
-            evidence=result.evidence,
-            domain_context=result.domain_context or {},
+    # Single pass: convert to OracleCallResult and accumulate verdict statistics
+    oracle_calls = []
+    has_false = has_true = False
+    false_conf_sum = true_conf_sum = 0.0
+    false_conf_n = true_conf_n = 0
+    min_conf = 1.0
+
+    for result in oracle_results:
+        # The source OracleResult is already validated, so skip re-validating its fields
+        oracle_calls.append(
+            OracleCallResult.model_construct(
+                oracle_name=result.oracle_name,
+                verdict=result.verdict,
+                confidence=result.confidence,
+                evidence=result.evidence,
+                domain_context=result.domain_context or {},
+            )
         )
-        for result in oracle_results
-    ]
 
-    # Extract verdicts and confidences
-    verdicts = [result.verdict for result in oracle_results]
-    confidences = [result.confidence for result in oracle_results]
+        confidence = result.confidence
+        if confidence < min_conf:
+            min_conf = confidence
+
+        if result.verdict == "likely_false":
+            has_false = True
+            false_conf_sum += confidence
+            false_conf_n += 1
+        elif result.verdict == "likely_true":
+            has_true = True
+            true_conf_sum += confidence
+            true_conf_n += 1
 
     # Apply deterministic aggregation rules
     # Note: "unsupported" verdicts are treated the same as "uncertain" and do not affect
     # the final verdict. This is intentional - an oracle returning "unsupported" indicates
     # it cannot process the claim, not that the claim is false.
-    final_verdict = "uncertain"
-    final_confidence = 0.3
 
     # Rule 1: If any oracle verdict == "likely_false", final = likely_false
-    if "likely_false" in verdicts:
+    if has_false:
         final_verdict = "likely_false"
         # For mixed verdicts (true/false), choose the lowest confidence
-        if "likely_true" in verdicts:
-            final_confidence = min(confidences)
+        if has_true:
+            final_confidence = min_conf
         else:
             # All are likely_false or uncertain/unsupported
-            false_confidences = [c for v, c in zip(verdicts, confidences) if v == "likely_false"]
-            final_confidence = (
-                sum(false_confidences) / len(false_confidences) if false_confidences else 0.3
-            )
+            final_confidence = false_conf_sum / false_conf_n
 
     # Rule 2: Else if any oracle verdict == "likely_true", final = likely_true
-    elif "likely_true" in verdicts:
+    elif has_true:
         final_verdict = "likely_true"
         # All supporting (true-ish), average the confidences
-        true_confidences = [c for v, c in zip(verdicts, confidences) if v == "likely_true"]
-        final_confidence = (
-            sum(true_confidences) / len(true_confidences) if true_confidences else 0.3
-        )
+        final_confidence = true_conf_sum / true_conf_n
 
     # Rule 3: Else (all uncertain/unsupported), final = uncertain
     else:
         final_verdict = "uncertain"
         final_confidence = 0.3
 
-    return AggregateResult(
+    # Every input is an already-validated model and the final confidence is a min or mean
+    # of validated confidences, so it stays within [0, 1]; skip re-validation
+    return AggregateResult.model_construct(
         final_verdict=final_verdict,
         final_confidence=final_confidence,
-        oracle_calls=oracle_calls,
+        oracle_calls=tuple(oracle_calls),
         domain=domain,
         claim=claim,
     )
@@ -13,6 +13,9 @@ from server.schemas.oracle_result import OracleResult
 class Oracle(ABC):
     """Abstract base class for all oracles."""
 
+    # Oracles are stateless or hold a few fixed attributes, so skip the per-instance dict
+    __slots__ = ()
+
     name: str
 
     @abstractmethod
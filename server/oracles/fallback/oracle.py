@@ -13,6 +13,8 @@ from server.schemas.oracle_result import OracleResult
 class LLMOracle(Oracle):
     """Stub oracle for LLM-based fact checking."""
 
+    __slots__ = ()
+
     name = "llm_oracle"
 
     def analyze(self, claim: Claim, domain: DomainResult) -> OracleResult:
@@ -26,10 +28,17 @@ class LLMOracle(Oracle):
         Returns:
             OracleResult with 'uncertain' verdict
         """
-        return OracleResult(
-            oracle_name=self.name,
-            verdict="uncertain",
-            confidence=0.3,
-            evidence=[],
-            domain_context={"reason": "LLM oracle not yet implemented"},
-        )
+        return _UNCERTAIN_RESULT
+
+
+# The stub's answer never depends on the claim, so build it once and share it.
+# Callers must treat it as read-only. It is shared across threadpool workers, which
+# is safe because the model is frozen and its domain_context dict is only ever read
+# (by logging and response serialization), never written.
+_UNCERTAIN_RESULT = OracleResult(
+    oracle_name=LLMOracle.name,
+    verdict="uncertain",
+    confidence=0.3,
+    evidence=(),
+    domain_context={"reason": "LLM oracle not yet implemented"},
+)
@@ -0,0 +1,65 @@
+"""
+One-off migration of cached price CSVs to Parquet.
+
+The Finance Oracle reads `{ticker}.parquet` in preference to `{ticker}.csv`, so
+converting the cache once removes CSV and timestamp parsing from every request.
+
+Usage:
+    python -m server.oracles.finance.migrate [PRICE_DIR]
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from server.oracles.finance.oracle import FinanceOracle, read_price_csv
+
+
+def convert_price_csv_to_parquet(csv_path: Path) -> Optional[Path]:
+    """
+    Convert a price CSV to a Snappy-compressed Parquet file next to it.
+
+    Args:
+        csv_path: Path to the `{ticker}.csv` file
+
+    Returns:
+        Path of the written Parquet file, or None if the CSV could not be read
+    """
+    df = read_price_csv(csv_path)
+    if df is None:
+        return None
+
+    parquet_path = csv_path.with_suffix(".parquet")
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(table, parquet_path, compression="snappy")
+    return parquet_path
+
+
+def main(price_data_dir: Optional[Path] = None) -> list[Path]:
+    """
+    Convert every price CSV in a directory to Parquet.
+
+    Args:
+        price_data_dir: Directory holding `{ticker}.csv` files, defaults to the
+            Finance Oracle's price cache
+
+    Returns:
+        Paths of the Parquet files written
+    """
+    if price_data_dir is None:
+        price_data_dir = FinanceOracle().price_data_dir
+
+    written = []
+    for csv_path in sorted(price_data_dir.glob("*.csv")):
+        parquet_path = convert_price_csv_to_parquet(csv_path)
+        if parquet_path is not None:
+            written.append(parquet_path)
+    return written
+
+
+if __name__ == "__main__":
+    for path in main(Path(sys.argv[1]) if len(sys.argv) > 1 else None):
+        print(path)
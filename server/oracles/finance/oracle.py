@@ -5,30 +5,518 @@ Validates claims about price movements by analyzing cached price data and news e
 Example: "SOL jumped 8% after ETF approval this morning."
 """
 
-import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, ClassVar, Optional
 from zoneinfo import ZoneInfo
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from server.oracles.base import Oracle
 from server.schemas.claim import Claim, DomainResult
 from server.schemas.oracle_result import EvidenceItem, OracleResult
 
+# Date hints that map to a market open, as days before the current New York date
+_DATE_HINT_DAYS_AGO = {"today": 0, "this morning": 0, "yesterday": 1}
+_DATE_HINT_RE = re.compile(r"\b(today|yesterday|this morning)\b")
+
+# Use America/New_York timezone to properly handle EST/EDT
+_NY_TZ = ZoneInfo("America/New_York")
+
+# Verdicts by the codes returned from FinanceOracle._classify_claim_vec
+_VERDICT_LABELS = ("uncertain", "likely_true", "likely_false")
+
+# Evidence stance and stance confidence by verdict; any other verdict is unrelated
+# with low confidence. Simple heuristic: if likely_true, news supports; if
+# likely_false, unrelated
+_VERDICT_TO_STANCE = {"likely_true": ("supports", 0.6), "likely_false": ("unrelated", 0.5)}
+_DEFAULT_STANCE = ("unrelated", 0.3)
+
+# Shared result for claims without news, so no empty list is allocated per call
+EMPTY_EVIDENCE: tuple[EvidenceItem, ...] = ()
+
+# Root of the cached price and news data
+_BASE_DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+# Columns of a normalized price table, in order
+PRICE_COLUMNS = ["timestamp", "price", "volume"]
+
+# Metric windows around an event bar
+_PRE_EVENT_WINDOW = np.timedelta64(30, "m")
+_POST_EVENT_WINDOW = np.timedelta64(30, "m")
+_HISTORY_WINDOW = np.timedelta64(7, "D")
+
+# Per-row relative error allowed in a prefix-sum volume variance before the range is
+# recomputed directly; scaled by the series length, as summation error grows with it
+_PREFIX_SUM_TOLERANCE = 1e6 * np.finfo(np.float64).eps
+
+# CSV columns needed to build a price table from either supported schema
+_CSV_COLUMNS = frozenset({"timestamp", "price", "close", "volume"})
+
+
+def read_price_csv(csv_path: Path) -> Optional[pd.DataFrame]:
+    """
+    Read and normalize a cached price CSV.
+
+    Supports two CSV schemas:
+    1. Simple: timestamp, price, volume
+    2. OHLC: timestamp, open, high, low, close, volume (price = close)
+
+    Only the columns the oracle uses are parsed; for OHLC files the open, high and
+    low columns are skipped.
+
+    Args:
+        csv_path: Path to the CSV file
+
+    Returns:
+        DataFrame with UTC timestamp, price and volume columns sorted by timestamp,
+        or None if the file cannot be read or has an unknown schema
+    """
+    try:
+        df = pd.read_csv(csv_path, usecols=lambda column: column in _CSV_COLUMNS)
+        if not {"timestamp", "volume"}.issubset(df.columns):
+            return None
+
+        # Simple schema has a price column; otherwise take the OHLC close
+        if "price" not in df.columns:
+            if "close" not in df.columns:
+                return None
+            df["price"] = df["close"]
+
+        # Parse timestamps with UTC awareness and handle errors
+        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True, errors="coerce")
+
+        # Drop rows with invalid timestamps and sort by timestamp
+        df = df.dropna(subset=["timestamp"]).sort_values("timestamp").reset_index(drop=True)
+
+        # Store volumes in the smallest integer type that fits, which is lossless and
+        # shrinks the bytes touched by volume statistics. Prices stay float64: float32
+        # keeps only ~7 significant digits, too coarse for 30-minute returns on large
+        # prices. The Parquet migration writes these dtypes, so Parquet reads need no cast.
+        df["volume"] = pd.to_numeric(df["volume"], downcast="integer")
+
+        return df[PRICE_COLUMNS]
+    except Exception:
+        return None
+
+
+def read_price_parquet(parquet_path: Path) -> Optional[pd.DataFrame]:
+    """
+    Read a migrated price Parquet file.
+
+    Args:
+        parquet_path: Path to the Parquet file
+
+    Returns:
+        DataFrame with timestamp, price and volume columns, or None if it cannot be read
+    """
+    # Memory-map the file so Arrow buffers are backed by the OS page cache rather than
+    # copied through buffered reads, and release each column as it is converted.
+    # Only the needed columns are decoded; pyarrow raises ArrowInvalid (a ValueError)
+    # straight away if one of them is missing, so no separate schema check is needed
+    try:
+        with pa.memory_map(str(parquet_path), "r") as source:
+            table = pq.read_table(source, columns=PRICE_COLUMNS)
+            return table.to_pandas(self_destruct=True, split_blocks=True)
+    except (OSError, ValueError):
+        return None
+
+
+def parse_news_timestamp(value: Any) -> Optional[datetime]:
+    """
+    Parse an ISO-8601 news timestamp.
+
+    Args:
+        value: Raw timestamp value from a news item
+
+    Returns:
+        UTC timezone-aware datetime (naive values are assumed UTC), or None if the
+        value cannot be parsed
+    """
+    try:
+        ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+    # Ensure timezone-aware
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts
+
+
+def news_search_text(item: dict) -> tuple[str, str]:
+    """
+    Lowercased title and content of a news item, as matched by relevance scoring.
+
+    Args:
+        item: News item dictionary
+
+    Returns:
+        Tuple of (title, content), lowercased
+    """
+    # The first of summary/content/description that is present, even if empty;
+    # checked in order so later keys are only looked up when needed
+    for key in ("summary", "content", "description"):
+        if key in item:
+            content = item[key]
+            break
+    else:
+        content = ""
+    return item.get("title", "").lower(), content.lower()
+
+
+def news_body(item: dict) -> str:
+    """
+    Body text of a news item for evidence excerpts.
+
+    Args:
+        item: News item dictionary
+
+    Returns:
+        The first non-empty of summary, content and description, or ""
+    """
+    return item.get("summary") or item.get("content") or item.get("description") or ""
+
+
+@dataclass(frozen=True)
+class NewsSearchIndex:
+    """Lowercased search text of timestamped news items, for vectorized relevance scoring."""
+
+    # Kept as plain strings: fixed-width NumPy string arrays would pad every item to
+    # the longest one, so a single long article would inflate the whole cached index
+    titles: tuple[str, ...]
+    contents: tuple[str, ...]
+    # Parsed timestamp of each item, None where it could not be parsed
+    timestamps: tuple[Optional[datetime], ...]
+    has_timestamp: np.ndarray
+
+    @classmethod
+    def from_items(cls, items: list[dict]) -> "NewsSearchIndex":
+        """
+        Index news items prepared by read_news_json.
+
+        Args:
+            items: Timestamped news items carrying "_title_lower", "_content_lower"
+                and "_ts", in file order
+
+        Returns:
+            NewsSearchIndex over the items
+        """
+        timestamps = tuple(item["_ts"] for item in items)
+        return cls(
+            titles=tuple(item["_title_lower"] for item in items),
+            contents=tuple(item["_content_lower"] for item in items),
+            timestamps=timestamps,
+            has_timestamp=np.array([ts is not None for ts in timestamps], dtype=bool),
+        )
+
+    def best_timestamp(self, ticker: Optional[str], companies: list[str]) -> Optional[datetime]:
+        """
+        Timestamp of the news item most relevant to a claim.
+
+        Ticker mentions score 3 in the title and 1 in the content, company mentions
+        2 and 1. Matches the in-order scan in FinanceOracle._extract_event_timestamp.
+
+        Args:
+            ticker: Lowercased ticker, if any
+            companies: Lowercased company names
+
+        Returns:
+            Parsed timestamp of the best scoring item, or None if there is none
+        """
+        n_items = len(self.titles)
+        if n_items == 0:
+            return None
+
+        # Substring tests run per item in C via str.__contains__; the score arithmetic
+        # and best-item selection are vectorized
+        scores = np.zeros(n_items, dtype=np.int64)
+        for term, title_weight in ([(ticker, 3)] if ticker else []) + [(c, 2) for c in companies]:
+            scores += title_weight * np.fromiter(
+                (term in title for title in self.titles), dtype=bool, count=n_items
+            )
+            scores += np.fromiter(
+                (term in content for content in self.contents), dtype=bool, count=n_items
+            )
+
+        # Same selection as scanning the items in order: an item takes over when it
+        # beats every earlier score, and its timestamp is used if it could be parsed
+        earlier_best = np.maximum.accumulate(np.concatenate(([-1], scores[:-1])))
+        candidates = np.flatnonzero((scores > earlier_best) & self.has_timestamp)
+        return self.timestamps[candidates[-1]] if len(candidates) else None
+
+
+class NewsItems(list):
+    """News items loaded from disk, with a search index over the timestamped ones."""
+
+    search_index: Optional[NewsSearchIndex] = None
+
+
+def read_news_json(json_path: Path) -> Optional[list]:
+    """
+    Read a cached news JSON file.
+
+    Each item gets its evidence body stored under "_body". Items with a timestamp
+    also get the parsed value under "_ts" and their lowercased title and content
+    under "_title_lower" and "_content_lower", so the parsing and lowercasing happen
+    once per load instead of once per analyzed claim.
+
+    Args:
+        json_path: Path to the JSON file
+
+    Returns:
+        NewsItems list of news items, or None if the file cannot be read or is not a
+        list. Its search_index is set when every item could be prepared.
+    """
+    try:
+        with open(json_path, "rb") as f:
+            news = orjson.loads(f.read())
+    except Exception:
+        return None
+
+    if not isinstance(news, list):
+        return None
+
+    news = NewsItems(news)
+    timestamped = []
+    indexable = True
+    for item in news:
+        if not isinstance(item, dict):
+            indexable = False
+            continue
+        item["_body"] = news_body(item)
+        if "timestamp" in item:
+            item["_ts"] = parse_news_timestamp(item["timestamp"])
+            try:
+                item["_title_lower"], item["_content_lower"] = news_search_text(item)
+                timestamped.append(item)
+            except AttributeError:
+                # Non-string fields are left to fail where they are used, as before
+                indexable = False
+
+    if indexable:
+        news.search_index = NewsSearchIndex.from_items(timestamped)
+    return news
+
+
+@dataclass(frozen=True)
+class PriceSeries:
+    """A loaded price table together with its columns as raw arrays."""
+
+    frame: pd.DataFrame
+    # Bar times as UTC datetime64[ns], so window searches are plain integer comparisons
+    times: np.ndarray
+    prices: np.ndarray
+    volumes: np.ndarray
+    # Prefix sums for O(1) volume statistics over any row range; index i covers rows
+    # [0, i). Volumes are centered on volume_offset first to limit cancellation error.
+    # Missing volumes are skipped, as pandas mean() and std() do, so they add nothing
+    # to the sums and are left out of volume_count.
+    volume_offset: float
+    volume_count: np.ndarray
+    volume_cumsum: np.ndarray
+    volume_cumsum_sq: np.ndarray
+    # Number of adjacent volume changes before each row, to detect constant ranges exactly
+    volume_changes: np.ndarray
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "PriceSeries":
+        """
+        Wrap a normalized price DataFrame, extracting its column arrays once.
+
+        Args:
+            frame: DataFrame with timestamp, price and volume columns sorted by timestamp
+
+        Returns:
+            PriceSeries sharing the DataFrame's column buffers
+        """
+        timestamps = frame["timestamp"]
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_convert(None)
+
+        volumes = frame["volume"].to_numpy()
+        present = ~np.isnan(volumes.astype(np.float64, copy=False))
+        volume_offset = float(volumes[present].mean()) if present.any() else 0.0
+        centered = np.where(present, volumes - volume_offset, 0.0)
+
+        arrays = {
+            "times": timestamps.to_numpy().astype("datetime64[ns]", copy=False),
+            "prices": frame["price"].to_numpy(),
+            "volumes": volumes,
+            "volume_count": np.concatenate(([0], np.cumsum(present))),
+            "volume_cumsum": np.concatenate(([0.0], np.cumsum(centered))),
+            "volume_cumsum_sq": np.concatenate(([0.0], np.cumsum(centered * centered))),
+            "volume_changes": np.concatenate(([0], np.cumsum(volumes[1:] != volumes[:-1]))),
+        }
+        # Series are shared through the process-wide cache, so any in-place write
+        # would leak into other requests; make that an error instead
+        for array in arrays.values():
+            array.flags.writeable = False
+
+        return cls(frame=frame, volume_offset=volume_offset, **arrays)
+
+    def volume_mean(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """
+        Mean of volumes in rows [lo, hi), elementwise over arrays of ranges.
+
+        Args:
+            lo: First row of each range
+            hi: One past the last row of each range; must be greater than lo
+
+        Returns:
+            Mean of the present volumes in each range; NaN where all are missing
+        """
+        n = self.volume_count[hi] - self.volume_count[lo]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.volume_offset + (self.volume_cumsum[hi] - self.volume_cumsum[lo]) / n
+
+    def volume_stats(self, lo: np.ndarray, hi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Mean and sample standard deviation (ddof=1) of volumes in rows [lo, hi).
+
+        Works elementwise, so many ranges can be evaluated at once. Ranges where the
+        prefix sums would lose precision are computed directly from the volumes.
+        Missing volumes are skipped; a range with fewer than two present volumes has
+        a NaN standard deviation, as in pandas.
+
+        Args:
+            lo: First row of each range
+            hi: One past the last row of each range; must be at least lo + 2
+
+        Returns:
+            Tuple of (mean, standard deviation) arrays
+        """
+        shape = np.broadcast(lo, hi).shape
+        lo, hi = np.broadcast_arrays(np.atleast_1d(lo), np.atleast_1d(hi))
+        n = self.volume_count[hi] - self.volume_count[lo]
+        total = self.volume_cumsum[hi] - self.volume_cumsum[lo]
+        total_sq = self.volume_cumsum_sq[hi] - self.volume_cumsum_sq[lo]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.volume_offset + total / n
+            sum_sq_dev = total_sq - total * total / n
+
+        # Each prefix sum carries rounding error proportional to its magnitude, so a
+        # range whose spread is small next to the sums around it (a quiet stretch in a
+        # series of much larger volumes) loses every significant digit to
+        # cancellation. Recompute those ranges directly from the volumes.
+        tolerance = _PREFIX_SUM_TOLERANCE * len(self.volumes)
+        for k in np.flatnonzero(sum_sq_dev <= tolerance * self.volume_cumsum_sq[hi]):
+            window = self.volumes[lo[k] : hi[k]].astype(np.float64)
+            window = window[~np.isnan(window)]
+            mean[k] = window.mean()
+            sum_sq_dev[k] = np.square(window - mean[k]).sum()
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            variance = np.maximum(sum_sq_dev / (n - 1), 0.0)
+
+        # A range without any change in volume has exactly zero spread
+        constant = self.volume_changes[hi - 1] == self.volume_changes[lo]
+        std = np.where(constant, 0.0, np.sqrt(variance))
+        return mean.reshape(shape), std.reshape(shape)
+
+
+def _read_price_series(reader: Callable[[Path], Optional[pd.DataFrame]]):
+    """Adapt a price file reader to return a PriceSeries for the file cache."""
+
+    def load(path: Path) -> Optional[PriceSeries]:
+        frame = reader(path)
+        return None if frame is None else PriceSeries.from_frame(frame)
+
+    return load
+
+
+_read_parquet_series = _read_price_series(read_price_parquet)
+_read_csv_series = _read_price_series(read_price_csv)
+
+
+class _FileCache:
+    """Thread-safe LRU cache of parsed data files, invalidated by file mtime and a TTL."""
+
+    def __init__(self, maxsize: int = 64, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of files kept in memory
+            ttl: Seconds after which an entry is re-read even if the file is unchanged
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Path, tuple[int, float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, loader: Callable[[Path], Any]) -> Any:
+        """
+        Return the parsed contents of a file, loading it only when stale.
+
+        Cached values are shared between callers and must be treated as read-only.
+
+        Args:
+            path: Path to the file
+            loader: Function parsing the file, called on a miss
+
+        Returns:
+            The loader's result for the current version of the file, or None if the
+            file does not exist
+        """
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == mtime_ns and now - entry[1] < self.ttl:
+                self._entries.move_to_end(path)
+                return entry[2]
+
+        # Load outside the lock so a slow parse does not block hits on other files;
+        # concurrent misses on the same file may both load it, and the last one wins
+        value = loader(path)
+        with self._lock:
+            self._entries[path] = (mtime_ns, now, value)
+            self._entries.move_to_end(path)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide caches so repeat claims about the same ticker skip disk I/O and parsing
+_price_cache = _FileCache()
+_news_cache = _FileCache()
+
 
 class FinanceOracle(Oracle):
     """Oracle that validates price movement claims using cached data."""
 
+    __slots__ = ("price_data_dir", "news_data_dir")
+
     name = "finance"
 
+    # Paths to cached data, computed once at import rather than per instance
+    _DEFAULT_PRICE_DATA_DIR: ClassVar[Path] = _BASE_DATA_DIR / "prices"
+    _DEFAULT_NEWS_DATA_DIR: ClassVar[Path] = _BASE_DATA_DIR / "news"
+
     def __init__(self):
         """Initialize the Finance Oracle."""
-        # Path to cached data
-        base_data_dir = Path(__file__).parent.parent.parent / "data"
-        self.price_data_dir = base_data_dir / "prices"
-        self.news_data_dir = base_data_dir / "news"
+        self.price_data_dir = self._DEFAULT_PRICE_DATA_DIR
+        self.news_data_dir = self._DEFAULT_NEWS_DATA_DIR
 
     def analyze(self, claim: Claim, domain: DomainResult) -> OracleResult:
         """
@@ -43,64 +531,141 @@ class FinanceOracle(Oracle):
         """
         # Check if we have a ticker to analyze
         if not claim.tickers:
-            return OracleResult(
-                oracle_name=self.name,
-                verdict="unsupported",
-                confidence=0.0,
-                evidence=[],
-                domain_context={"reason": "No ticker identified in claim"},
-            )
+            return self._unsupported("No ticker identified in claim")
 
         # Use the first ticker if multiple are present
         ticker = claim.tickers[0]
 
-        # Load cached data
-        price_data = self._load_price_data(ticker)
-        news_data = self._load_news_data(ticker)
+        # Load cached price data; news is only needed once prices are available
+        price_series = self._load_price_series(ticker)
+        if price_series is None:
+            return self._unsupported(f"No cached price data for {ticker}")
 
-        if price_data is None:
-            return OracleResult(
-                oracle_name=self.name,
-                verdict="unsupported",
-                confidence=0.0,
-                evidence=[],
-                domain_context={"reason": f"No cached price data for {ticker}"},
-            )
+        news_data = self._load_news_data(ticker)
 
         # Extract event timestamp (with price data for snapping)
-        event_timestamp = self._extract_event_timestamp(claim, news_data, price_data)
+        event_timestamp = self._extract_event_timestamp(claim, news_data, price_series)
 
         if event_timestamp is None:
             # If we can't find an event, return uncertain
-            return OracleResult(
-                oracle_name=self.name,
-                verdict="uncertain",
-                confidence=0.3,
-                evidence=self._build_evidence_items(news_data, ticker, "uncertain"),
-                domain_context={
-                    "reason": "Could not identify event timestamp",
-                    "ticker": ticker,
-                },
-            )
+            return self._uncertain("Could not identify event timestamp", news_data, ticker)
 
         # Compute metrics
-        metrics = self._compute_metrics(price_data, event_timestamp, claim.percentages)
+        metrics = self._compute_metrics(price_series, event_timestamp, claim.percentages)
+
+        return self._result_from_metrics(news_data, ticker, event_timestamp, metrics)
+
+    def analyze_batch(self, pairs: list[tuple[Claim, DomainResult]]) -> list[OracleResult]:
+        """
+        Analyze many financial claims, sharing work between claims about the same ticker.
+
+        Claims are grouped by ticker so each ticker's price and news data is loaded once,
+        and the metric windows for all of its claims are computed in one vectorized pass.
+
+        Args:
+            pairs: (claim, domain) pairs to analyze
+
+        Returns:
+            OracleResult for each pair, in input order; identical to calling analyze on
+            each pair
+        """
+        results: list[Optional[OracleResult]] = [None] * len(pairs)
+
+        # Group claims by ticker (the first one, as in analyze)
+        indices_by_ticker: dict[str, list[int]] = {}
+        for i, (claim, _domain) in enumerate(pairs):
+            if claim.tickers:
+                indices_by_ticker.setdefault(claim.tickers[0], []).append(i)
+            else:
+                results[i] = self._unsupported("No ticker identified in claim")
+
+        for ticker, indices in indices_by_ticker.items():
+            price_series = self._load_price_series(ticker)
+            if price_series is None:
+                for i in indices:
+                    results[i] = self._unsupported(f"No cached price data for {ticker}")
+                continue
+
+            news_data = self._load_news_data(ticker)
+
+            # Event timestamps still depend on each claim's own hints and companies
+            timed: list[tuple[int, datetime]] = []
+            for i in indices:
+                event_timestamp = self._extract_event_timestamp(
+                    pairs[i][0], news_data, price_series
+                )
+                if event_timestamp is None:
+                    results[i] = self._uncertain(
+                        "Could not identify event timestamp", news_data, ticker
+                    )
+                else:
+                    timed.append((i, event_timestamp))
+
+            metrics_list = self._compute_metrics_batch(
+                price_series,
+                [event_timestamp for _, event_timestamp in timed],
+                [pairs[i][0].percentages for i, _ in timed],
+            )
+            # Classify every claim with enough data in one vectorized pass
+            measured = [metrics for metrics in metrics_list if metrics is not None]
+            verdict_codes, confidences = self._classify_claim_vec(
+                np.array([metrics["pre_event_return"] for metrics in measured]),
+                np.array([metrics["post_event_return"] for metrics in measured]),
+                np.array([metrics["abnormal_volume_z"] for metrics in measured]),
+                np.array([metrics["percentage_mismatch"] for metrics in measured], dtype=bool),
+            )
+            classifications = iter(
+                zip([_VERDICT_LABELS[code] for code in verdict_codes], confidences.tolist())
+            )
+
+            for (i, event_timestamp), metrics in zip(timed, metrics_list):
+                results[i] = self._result_from_metrics(
+                    news_data,
+                    ticker,
+                    event_timestamp,
+                    metrics,
+                    next(classifications) if metrics is not None else None,
+                )
+
+        return results
+
+    def _result_from_metrics(
+        self,
+        news_data: Optional[list],
+        ticker: str,
+        event_timestamp: datetime,
+        metrics: Optional[dict],
+        classification: Optional[tuple[str, float]] = None,
+    ) -> OracleResult:
+        """
+        Build the result for a claim once its event metrics have been computed.
+
+        Args:
+            news_data: List of news items to cite as evidence
+            ticker: Stock ticker symbol
+            event_timestamp: The snapped event timestamp
+            metrics: Output of _compute_metrics, or None if there was too little data
+            classification: Precomputed (verdict, confidence) for the metrics, classified
+                here if not provided
+
+        Returns:
+            OracleResult with the classified verdict, or uncertain without metrics
+        """
+        # Format the timestamp once for whichever result is returned
+        event_timestamp_iso = event_timestamp.isoformat()
 
         if metrics is None:
-            return OracleResult(
-                oracle_name=self.name,
-                verdict="uncertain",
-                confidence=0.3,
-                evidence=self._build_evidence_items(news_data, ticker, "uncertain"),
-                domain_context={
-                    "reason": "Insufficient data around event time",
-                    "ticker": ticker,
-                    "event_timestamp": event_timestamp.isoformat() if event_timestamp else None,
-                },
+            return self._uncertain(
+                "Insufficient data around event time",
+                news_data,
+                ticker,
+                event_timestamp=event_timestamp_iso,
             )
 
         # Classify the claim
-        verdict, confidence = self._classify_claim(metrics)
+        if classification is None:
+            classification = self._classify_claim(metrics)
+        verdict, confidence = classification
 
         # Build evidence items
         evidence = self._build_evidence_items(news_data, ticker, verdict)
@@ -112,18 +677,78 @@ class FinanceOracle(Oracle):
             evidence=evidence,
             domain_context={
                 "ticker": ticker,
-                "event_timestamp": event_timestamp.isoformat() if event_timestamp else None,
+                "event_timestamp": event_timestamp_iso,
                 "pre_event_return": metrics.get("pre_event_return"),
                 "post_event_return": metrics.get("post_event_return"),
                 "abnormal_volume_z": metrics.get("abnormal_volume_z"),
             },
         )
 
+    def _unsupported(self, reason: str) -> OracleResult:
+        """
+        Build the result for a claim this oracle cannot analyze.
+
+        Args:
+            reason: Why the claim is unsupported
+
+        Returns:
+            OracleResult with an "unsupported" verdict and no evidence
+        """
+        return OracleResult(
+            oracle_name=self.name,
+            verdict="unsupported",
+            confidence=0.0,
+            evidence=EMPTY_EVIDENCE,
+            domain_context={"reason": reason},
+        )
+
+    def _uncertain(
+        self, reason: str, news_data: Optional[list], ticker: str, **context
+    ) -> OracleResult:
+        """
+        Build the result for a claim whose price reaction could not be measured.
+
+        Args:
+            reason: Why no verdict could be reached
+            news_data: List of news items to cite as evidence
+            ticker: Stock ticker symbol
+            **context: Additional domain context entries
+
+        Returns:
+            OracleResult with an "uncertain" verdict
+        """
+        return OracleResult(
+            oracle_name=self.name,
+            verdict="uncertain",
+            confidence=0.3,
+            evidence=self._build_evidence_items(news_data, ticker, "uncertain"),
+            domain_context={"reason": reason, "ticker": ticker, **context},
+        )
+
     def _load_price_data(self, ticker: str) -> Optional[pd.DataFrame]:
         """
         Load cached price data for a ticker.
 
-        Supports two CSV schemas:
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            DataFrame with price data or None if not found
+        """
+        price_series = self._load_price_series(ticker)
+        return price_series.frame if price_series is not None else None
+
+    def _load_price_series(self, ticker: str) -> Optional[PriceSeries]:
+        """
+        Load cached price data for a ticker along with its raw column arrays.
+
+        Parsed files are kept in a process-wide cache keyed on path and mtime, so the
+        returned data is shared and must not be modified.
+
+        Prefers a pre-built Parquet file (see server.oracles.finance.migrate), which
+        stores typed, UTC-normalized and sorted columns so no parsing is needed, as
+        long as it is at least as new as the CSV next to it. Falls back to CSV when
+        the Parquet file is older or unreadable. CSV supports two schemas:
         1. Simple: timestamp, price, volume
         2. OHLC: timestamp, open, high, low, close, volume (price = close)
 
@@ -131,33 +756,28 @@ class FinanceOracle(Oracle):
             ticker: Stock ticker symbol
 
         Returns:
-            DataFrame with price data or None if not found
+            PriceSeries or None if not found
         """
+        parquet_path = self.price_data_dir / f"{ticker}.parquet"
         csv_path = self.price_data_dir / f"{ticker}.csv"
-        if not csv_path.exists():
-            return None
 
         try:
-            df = pd.read_csv(csv_path)
-
-            # Check for simple schema (timestamp, price, volume)
-            if {"timestamp", "price", "volume"}.issubset(df.columns):
-                pass
-            # Check for OHLC schema (timestamp, open, high, low, close, volume)
-            elif {"timestamp", "open", "high", "low", "close", "volume"}.issubset(df.columns):
-                df["price"] = df["close"]
-            else:
-                return None
-
-            # Parse timestamps with UTC awareness and handle errors
-            df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True, errors="coerce")
-
-            # Drop rows with invalid timestamps and sort by timestamp
-            df = df.dropna(subset=["timestamp"]).sort_values("timestamp").reset_index(drop=True)
-
-            return df[["timestamp", "price", "volume"]]
-        except Exception:
-            return None
+            parquet_mtime_ns = parquet_path.stat().st_mtime_ns
+        except OSError:
+            parquet_mtime_ns = None
+
+        if parquet_mtime_ns is not None:
+            # A CSV refreshed after the migration makes the Parquet copy stale
+            try:
+                csv_is_newer = csv_path.stat().st_mtime_ns > parquet_mtime_ns
+            except OSError:
+                csv_is_newer = False
+            if not csv_is_newer:
+                price_series = _price_cache.get(parquet_path, _read_parquet_series)
+                if price_series is not None:
+                    return price_series
+
+        return _price_cache.get(csv_path, _read_csv_series)
 
     def _load_news_data(self, ticker: str) -> Optional[list]:
         """
@@ -169,19 +789,13 @@ class FinanceOracle(Oracle):
         Returns:
             List of news items or None if not found
         """
-        json_path = self.news_data_dir / f"{ticker}_news.json"
-        if not json_path.exists():
-            return None
-
-        try:
-            with open(json_path) as f:
-                news = json.load(f)
-            return news if isinstance(news, list) else None
-        except Exception:
-            return None
+        return _news_cache.get(self.news_data_dir / f"{ticker}_news.json", read_news_json)
 
     def _extract_event_timestamp(
-        self, claim: Claim, news_data: Optional[list], price_data: Optional[pd.DataFrame] = None
+        self,
+        claim: Claim,
+        news_data: Optional[list],
+        price_series: Optional[PriceSeries] = None,
     ) -> Optional[datetime]:
         """
         Extract event timestamp from claim or news data and snap to nearest price bar.
@@ -189,7 +803,7 @@ class FinanceOracle(Oracle):
         Args:
             claim: The claim object
             news_data: List of news items
-            price_data: DataFrame with price data for timestamp snapping
+            price_series: Price data for timestamp snapping
 
         Returns:
             Event timestamp (UTC timezone-aware, snapped to nearest price bar) or None if not found
@@ -197,184 +811,215 @@ class FinanceOracle(Oracle):
         raw_timestamp = None
 
         # Try to use date_hint first
-        if claim.date_hint:
-            # Use America/New_York timezone to properly handle EST/EDT
-            ny_tz = ZoneInfo("America/New_York")
-            now_ny = datetime.now(ny_tz)
-
-            if "today" in claim.date_hint.lower():
-                # Market open 9:30 AM ET (automatically handles EST/EDT)
-                market_open_ny = now_ny.replace(hour=9, minute=30, second=0, microsecond=0)
-                raw_timestamp = market_open_ny.astimezone(timezone.utc)
-            elif "yesterday" in claim.date_hint.lower():
-                # Use previous day at market open
-                yesterday_ny = now_ny - timedelta(days=1)
-                market_open_yesterday = yesterday_ny.replace(
-                    hour=9, minute=30, second=0, microsecond=0
-                )
-                raw_timestamp = market_open_yesterday.astimezone(timezone.utc)
-            elif "this morning" in claim.date_hint.lower():
-                # Use current day at market open
-                market_open_ny = now_ny.replace(hour=9, minute=30, second=0, microsecond=0)
-                raw_timestamp = market_open_ny.astimezone(timezone.utc)
+        match = _DATE_HINT_RE.search(claim.date_hint.lower()) if claim.date_hint else None
+        if match:
+            # Market open 9:30 AM ET on the hinted day; using America/New_York
+            # automatically handles EST/EDT
+            now_ny = datetime.now(_NY_TZ)
+            hint_day_ny = now_ny - timedelta(days=_DATE_HINT_DAYS_AGO[match.group(1)])
+            market_open_ny = hint_day_ny.replace(hour=9, minute=30, second=0, microsecond=0)
+            raw_timestamp = market_open_ny.astimezone(timezone.utc)
 
         # Try to extract from news data with relevance scoring
         if raw_timestamp is None and news_data:
-            ticker = claim.tickers[0] if claim.tickers else None
-            companies = claim.companies if claim.companies else []
+            # Lowercase the search terms once rather than once per news item
+            ticker = claim.tickers[0].lower() if claim.tickers else None
+            companies = [company.lower() for company in claim.companies]
 
-            best_score = -1
             best_timestamp = None
 
-            for item in news_data:
-                if "timestamp" not in item:
-                    continue
-
-                # Calculate relevance score
-                score = 0
-                title = item.get("title", "").lower()
-                content = item.get(
-                    "summary", item.get("content", item.get("description", ""))
-                ).lower()
-
-                # Check for ticker mention
-                if ticker and ticker.lower() in title:
-                    score += 3
-                if ticker and ticker.lower() in content:
-                    score += 1
-
-                # Check for company mention
-                for company in companies:
-                    if company.lower() in title:
-                        score += 2
-                    if company.lower() in content:
+            # News loaded from the cache is scored in one vectorized pass
+            search_index = getattr(news_data, "search_index", None)
+            if search_index is not None:
+                best_timestamp = search_index.best_timestamp(ticker, companies)
+            else:
+                best_score = -1
+                for item in news_data:
+                    if "timestamp" not in item:
+                        continue
+
+                    # Calculate relevance score
+                    score = 0
+                    # Items loaded from the cache carry their search text pre-lowercased
+                    if "_title_lower" in item:
+                        title, content = item["_title_lower"], item["_content_lower"]
+                    else:
+                        title, content = news_search_text(item)
+
+                    # Check for ticker mention
+                    if ticker and ticker in title:
+                        score += 3
+                    if ticker and ticker in content:
                         score += 1
 
-                if score > best_score:
-                    best_score = score
-                    try:
-                        ts = datetime.fromisoformat(item["timestamp"].replace("Z", "+00:00"))
-                        # Ensure timezone-aware
-                        if ts.tzinfo is None:
-                            ts = ts.replace(tzinfo=timezone.utc)
-                        best_timestamp = ts
-                    except Exception:
-                        continue
+                    # Check for company mention
+                    for company in companies:
+                        if company in title:
+                            score += 2
+                        if company in content:
+                            score += 1
+
+                    if score > best_score:
+                        best_score = score
+                        # Items loaded from the cache carry the timestamp pre-parsed
+                        if "_ts" in item:
+                            ts = item["_ts"]
+                        else:
+                            ts = parse_news_timestamp(item["timestamp"])
+                        if ts is not None:
+                            best_timestamp = ts
 
             if best_timestamp is not None:
                 raw_timestamp = best_timestamp
 
         # Snap to nearest price bar if we have price data
-        if raw_timestamp is not None and price_data is not None and len(price_data) > 0:
-            return self._snap_to_nearest_bar(raw_timestamp, price_data)
+        if raw_timestamp is not None and price_series is not None and len(price_series.times) > 0:
+            return self._snap_to_nearest_bar(raw_timestamp, price_series)
 
         return raw_timestamp
 
-    def _snap_to_nearest_bar(self, timestamp: datetime, price_data: pd.DataFrame) -> datetime:
+    def _snap_to_nearest_bar(self, timestamp: datetime, price_series: PriceSeries) -> datetime:
         """
         Snap a timestamp to the next price bar (forward-only snapping).
 
         Args:
-            timestamp: The raw timestamp to snap
-            price_data: DataFrame with price data
+            timestamp: The raw timestamp to snap (timezone-aware)
+            price_series: Non-empty price data, sorted by timestamp
 
         Returns:
-            Timestamp of the next price bar (or last bar if no future bars exist)
+            UTC timestamp of the next price bar (or last bar if no future bars exist)
         """
-        # Forward snap: find first bar at or after the timestamp
-        future_bars = price_data[price_data["timestamp"] >= timestamp]
-        if len(future_bars) > 0:
-            return future_bars.iloc[0]["timestamp"]
+        bar_times = price_series.times
+        target = pd.Timestamp(timestamp).tz_convert(None).to_datetime64()
 
-        # If no future bars, snap to last bar
-        return price_data.iloc[-1]["timestamp"]
+        # Forward snap: binary search for the first bar at or after the timestamp;
+        # if there are no future bars, snap to the last bar
+        index = min(int(np.searchsorted(bar_times, target, side="left")), len(bar_times) - 1)
+        return pd.Timestamp(bar_times[index]).tz_localize(timezone.utc)
 
     def _compute_metrics(
         self,
-        price_data: pd.DataFrame,
+        price_series: PriceSeries,
         event_timestamp: datetime,
-        claim_percentages: Optional[list] = None,
+        claim_percentages: Optional[Sequence[float]] = None,
     ) -> Optional[dict]:
         """
         Compute pre/post event returns and volume metrics using nearest bars.
 
         Args:
-            price_data: DataFrame with price and volume data
+            price_series: Price and volume data, sorted by timestamp
             event_timestamp: Timestamp of the event (already snapped to nearest bar)
             claim_percentages: Percentages mentioned in claim for comparison
 
         Returns:
             Dictionary with metrics or None if insufficient data
         """
-        # Find the event bar (should already be snapped)
-        event_idx = (price_data["timestamp"] - event_timestamp).abs().idxmin()
-        event_time = price_data.loc[event_idx, "timestamp"]
+        return self._compute_metrics_batch(price_series, [event_timestamp], [claim_percentages])[0]
 
-        # Define time windows (30 minutes before and after)
-        pre_start = event_time - timedelta(minutes=30)
-        post_end = event_time + timedelta(minutes=30)
+    def _compute_metrics_batch(
+        self,
+        price_series: PriceSeries,
+        event_timestamps: list[datetime],
+        claim_percentages: list[Optional[Sequence[float]]],
+    ) -> list[Optional[dict]]:
+        """
+        Compute pre/post event returns and volume metrics for many events at once.
 
-        # Get data for pre-event window (before event_time)
-        pre_data = price_data[
-            (price_data["timestamp"] >= pre_start) & (price_data["timestamp"] < event_time)
-        ]
+        Every window bound is found with one vectorized binary search over the sorted
+        timestamps, and returns and volume statistics are gathered with array indexing.
 
-        # Get data for post-event window (at and after event_time)
-        post_data = price_data[
-            (price_data["timestamp"] >= event_time) & (price_data["timestamp"] <= post_end)
-        ]
+        Args:
+            price_series: Price and volume data, sorted by timestamp
+            event_timestamps: Timestamp of each event (already snapped to nearest bar)
+            claim_percentages: Percentages mentioned in each claim for comparison
 
-        # Need at least 2 data points in each window for stable return estimation
-        if len(pre_data) < 2 or len(post_data) < 2:
-            return None
+        Returns:
+            Dictionary with metrics for each event, or None where data is insufficient
+        """
+        bar_times = price_series.times
+        prices = price_series.prices
+        n_bars = len(bar_times)
+        if n_bars == 0 or not event_timestamps:
+            return [None] * len(event_timestamps)
+
+        # Convert the events once to the same UTC datetime64[ns] representation
+        events = (
+            pd.to_datetime(event_timestamps, utc=True)
+            .tz_convert(None)
+            .to_numpy()
+            .astype("datetime64[ns]", copy=False)
+        )
 
-        # Calculate returns using first and last bars in each window
-        pre_event_return = (
-            (pre_data["price"].iloc[-1] - pre_data["price"].iloc[0]) / pre_data["price"].iloc[0]
-        ) * 100
+        # Find the event bar (should already be snapped): the nearest bar, preferring
+        # the earlier one on ties
+        after = np.searchsorted(bar_times, events, side="left")
+        after_idx = np.minimum(after, n_bars - 1)
+        before_idx = np.maximum(after - 1, 0)
+        use_before = (after >= n_bars) | (
+            (after > 0)
+            & (abs(events - bar_times[before_idx]) <= abs(bar_times[after_idx] - events))
+        )
+        event_times = bar_times[np.where(use_before, before_idx, after_idx)]
 
-        post_event_return = (
-            (post_data["price"].iloc[-1] - post_data["price"].iloc[0]) / post_data["price"].iloc[0]
-        ) * 100
+        # Timestamps are sorted, so each window is a contiguous row range whose bounds
+        # can be found by binary search instead of scanning the column with masks.
+        # Define time windows (30 minutes before and after)
+        pre_lo = np.searchsorted(bar_times, event_times - _PRE_EVENT_WINDOW, side="left")
+        event_lo = np.searchsorted(bar_times, event_times, side="left")
+        post_hi = np.searchsorted(bar_times, event_times + _POST_EVENT_WINDOW, side="right")
+
+        # Need at least 2 data points in each window for stable return estimation
+        valid = (event_lo - pre_lo >= 2) & (post_hi - event_lo >= 2)
+        rows = np.flatnonzero(valid)
+        pre_lo, event_lo, post_hi = pre_lo[rows], event_lo[rows], post_hi[rows]
+
+        # Calculate returns using first and last bars in each window: the pre-event
+        # window is before event_time, the post-event window at and after it
+        pre_first, pre_last = prices[pre_lo], prices[event_lo - 1]
+        post_first, post_last = prices[event_lo], prices[post_hi - 1]
+        pre_event_returns = ((pre_last - pre_first) / pre_first) * 100
+        post_event_returns = ((post_last - post_first) / post_first) * 100
 
         # Calculate abnormal volume z-score
         # Try 7 days of historical data, fallback to all available data
-        historical_start = event_time - timedelta(days=7)
-        historical_data = price_data[
-            (price_data["timestamp"] >= historical_start) & (price_data["timestamp"] < event_time)
-        ]
+        historical_lo = np.searchsorted(bar_times, event_times[rows] - _HISTORY_WINDOW, side="left")
 
         # If less than 7 days available, use all data before event
-        if len(historical_data) < 10:
-            historical_data = price_data[price_data["timestamp"] < event_time]
+        # (the pre-event window guarantees at least 2 bars of history either way)
+        historical_lo = np.where(event_lo - historical_lo < 10, 0, historical_lo)
+
+        # Precomputed prefix sums make the window statistics O(1)
+        historical_mean, historical_std = price_series.volume_stats(historical_lo, event_lo)
+        post_volume_mean = price_series.volume_mean(event_lo, post_hi)
+        has_spread = historical_std > 0
+        abnormal_volume_z = np.where(
+            has_spread,
+            (post_volume_mean - historical_mean) / np.where(has_spread, historical_std, 1.0),
+            0.0,
+        )
 
-        if len(historical_data) > 1:
-            historical_mean = historical_data["volume"].mean()
-            historical_std = historical_data["volume"].std()
-
-            if historical_std > 0:
-                post_volume_mean = post_data["volume"].mean()
-                abnormal_volume_z = (post_volume_mean - historical_mean) / historical_std
-            else:
-                abnormal_volume_z = 0.0
-        else:
-            abnormal_volume_z = 0.0
-
-        # Check if claim percentages disagree with computed returns
-        percentage_mismatch = False
-        if claim_percentages and len(claim_percentages) > 0:
-            claimed_pct = abs(claim_percentages[0])
-            actual_pct = abs(post_event_return)
-            # If claimed percentage differs from actual by more than 3%, flag it
-            if abs(claimed_pct - actual_pct) > 3.0:
-                percentage_mismatch = True
-
-        return {
-            "pre_event_return": float(pre_event_return),
-            "post_event_return": float(post_event_return),
-            "abnormal_volume_z": float(abnormal_volume_z),
-            "percentage_mismatch": percentage_mismatch,
-        }
+        metrics_list: list[Optional[dict]] = [None] * len(event_timestamps)
+        for j, i in enumerate(rows):
+            post_event_return = float(post_event_returns[j])
+
+            # Check if claim percentages disagree with computed returns
+            percentage_mismatch = False
+            percentages = claim_percentages[i]
+            if percentages and len(percentages) > 0:
+                claimed_pct = abs(percentages[0])
+                actual_pct = abs(post_event_return)
+                # If claimed percentage differs from actual by more than 3%, flag it
+                if abs(claimed_pct - actual_pct) > 3.0:
+                    percentage_mismatch = True
+
+            metrics_list[i] = {
+                "pre_event_return": float(pre_event_returns[j]),
+                "post_event_return": post_event_return,
+                "abnormal_volume_z": float(abnormal_volume_z[j]),
+                "percentage_mismatch": percentage_mismatch,
+            }
+
+        return metrics_list
 
     def _classify_claim(self, metrics: dict) -> tuple[str, float]:
         """
@@ -386,62 +1031,64 @@ class FinanceOracle(Oracle):
         Returns:
             Tuple of (verdict, confidence)
         """
-        pre_return = metrics["pre_event_return"]
-        post_return = metrics["post_event_return"]
-        volume_z = metrics["abnormal_volume_z"]
-        percentage_mismatch = metrics.get("percentage_mismatch", False)
+        verdict_codes, confidences = self._classify_claim_vec(
+            np.array([metrics["pre_event_return"]]),
+            np.array([metrics["post_event_return"]]),
+            np.array([metrics["abnormal_volume_z"]]),
+            np.array([metrics.get("percentage_mismatch", False)]),
+        )
+        return _VERDICT_LABELS[verdict_codes[0]], float(confidences[0])
 
+    def _classify_claim_vec(
+        self,
+        pre_return: np.ndarray,
+        post_return: np.ndarray,
+        volume_z: np.ndarray,
+        percentage_mismatch: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Classify many claims at once from their metrics, without per-claim branching.
+
+        Args:
+            pre_return: Pre-event returns in percent
+            post_return: Post-event returns in percent
+            volume_z: Abnormal volume z-scores
+            percentage_mismatch: Whether each claim's percentage disagrees with the move
+
+        Returns:
+            Tuple of (verdict codes indexing _VERDICT_LABELS as int8, confidences)
+        """
         # Classify based on the rules:
         # - likely_true: post_event_return > 0 AND post_event_return > pre_event_return
         # - likely_false: pre_event_return > post_event_return OR significant percentage mismatch
+        #   (the claim overstates/understates the actual movement)
         # - uncertain: otherwise
+        is_true = ~percentage_mismatch & (post_return > 0) & (post_return > pre_return)
+        is_false = percentage_mismatch | (pre_return > post_return)
+
+        # Use PR4 spec confidence formula: the largest relevant move in percent / 100,
+        # clamped to [0.1, 0.9]. A mismatch considers both returns; otherwise only the
+        # return on the side of the verdict counts.
+        return_diff = np.abs(post_return - pre_return)
+        magnitude = np.where(
+            percentage_mismatch,
+            np.maximum(np.maximum(np.abs(pre_return), np.abs(post_return)), return_diff),
+            np.maximum(np.where(is_true, np.abs(post_return), np.abs(pre_return)), return_diff),
+        )
+        base_confidence = np.clip(magnitude / 100.0, 0.1, 0.9)
 
-        # If percentage mismatch is significant, treat as likely_false
-        # (claim overstates/understates the actual movement)
-        if percentage_mismatch:
-            return_diff = abs(pre_return - post_return)
-            base_confidence = max(abs(pre_return), abs(post_return), return_diff) / 100.0
-            base_confidence = max(0.1, min(0.9, base_confidence))
-
-            # Boost confidence if abnormal volume
-            if volume_z > 1.0:
-                base_confidence = min(base_confidence + 0.1, 0.95)
-
-            return "likely_false", base_confidence
-
-        if post_return > 0 and post_return > pre_return:
-            # Claim is likely true
-            # Use PR4 spec confidence formula:
-            # base_conf = max(|post|, |post - pre|) / 100, clamped [0.1, 0.9]
-            return_diff = abs(post_return - pre_return)
-            base_confidence = max(abs(post_return), return_diff) / 100.0
-            base_confidence = max(0.1, min(0.9, base_confidence))
-
-            # Boost confidence if abnormal volume (z-score > 1)
-            if volume_z > 1.0:
-                base_confidence = min(base_confidence + 0.1, 0.95)
-
-            return "likely_true", base_confidence
-
-        elif pre_return > post_return:
-            # Claim is likely false
-            return_diff = abs(pre_return - post_return)
-            base_confidence = max(abs(pre_return), return_diff) / 100.0
-            base_confidence = max(0.1, min(0.9, base_confidence))
-
-            # Boost confidence if abnormal volume
-            if volume_z > 1.0:
-                base_confidence = min(base_confidence + 0.1, 0.95)
-
-            return "likely_false", base_confidence
+        # Boost confidence if abnormal volume (z-score > 1)
+        base_confidence = np.where(
+            volume_z > 1.0, np.minimum(base_confidence + 0.1, 0.95), base_confidence
+        )
 
-        else:
-            # Uncertain
-            return "uncertain", 0.4
+        verdict_codes = np.where(is_true, 1, np.where(is_false, 2, 0)).astype(np.int8)
+        confidences = np.where(verdict_codes == 0, 0.4, base_confidence)
+        return verdict_codes, confidences
 
     def _build_evidence_items(
         self, news_data: Optional[list], ticker: str, verdict: str
-    ) -> list[EvidenceItem]:
+    ) -> Sequence[EvidenceItem]:
         """
         Build evidence items from news data with stance inference.
 
@@ -451,10 +1098,14 @@ class FinanceOracle(Oracle):
             verdict: The verdict classification to infer stance
 
         Returns:
-            List of EvidenceItem objects with stance fields
+            EvidenceItem objects with stance fields; the shared EMPTY_EVIDENCE tuple
+            when there is no news
         """
         if not news_data:
-            return []
+            return EMPTY_EVIDENCE
+
+        # Infer stance based on verdict; it is the same for every item
+        stance, stance_conf = _VERDICT_TO_STANCE.get(verdict, _DEFAULT_STANCE)
 
         evidence_items = []
         for item in news_data[:5]:  # Limit to first 5 items
@@ -465,26 +1116,10 @@ class FinanceOracle(Oracle):
             url = item.get("url")
 
             # Extract first 200 characters as excerpt
-            # Use summary field first, fallback to content/description
-            content = item.get("summary", item.get("content", item.get("description", "")))
-            excerpt = content[:200] if content else None
-
-            # Infer stance based on verdict and content
-            stance = None
-            stance_conf = None
-
-            if verdict in ["likely_true", "likely_false"]:
-                # Simple heuristic: if likely_true, news supports;
-                # if likely_false, unrelated
-                if verdict == "likely_true":
-                    stance = "supports"
-                    stance_conf = 0.6
-                elif verdict == "likely_false":
-                    stance = "unrelated"
-                    stance_conf = 0.5
-            else:
-                stance = "unrelated"
-                stance_conf = 0.3
+            # Use summary field first, fallback to content/description; items loaded
+            # from the cache carry this body precomputed
+            content = item["_body"] if "_body" in item else news_body(item)
+            excerpt = content[:200] or None
 
             evidence_items.append(
                 EvidenceItem(
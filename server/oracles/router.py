@@ -7,9 +7,11 @@ Important assumptions:
 - Oracles must use forward-only timestamp snapping to avoid lookahead bias
   (e.g., FinanceOracle snaps event timestamps to the next available price bar)
 - Fallback is triggered by either low domain confidence OR uncertain primary verdict
+- Very low domain confidence skips the domain oracle and routes straight to the LLM oracle
 """
 
 import logging
+from functools import lru_cache
 
 from server.oracles.fallback import LLMOracle
 from server.oracles.finance import FinanceOracle
@@ -19,8 +21,21 @@ from server.schemas.oracle_result import OracleResult, OracleRoutingDecision
 
 PRIMARY_THRESHOLD = 0.6
 
+# Below this domain confidence the classification is close to noise, and the LLM
+# fallback would run anyway; skip the domain oracle (and its data loading) entirely
+SKIP_PRIMARY_THRESHOLD = 0.3
+
 logger = logging.getLogger(__name__)
 
+# Only six routing outcomes exist, so build each decision once and share it
+_ROUTING_DECISIONS = {
+    (primary, fallback_used): OracleRoutingDecision.model_construct(
+        primary_oracle=primary, fallback_used=fallback_used
+    )
+    for primary in ("finance", "tech_release", "general")
+    for fallback_used in (False, True)
+}
+
 
 class OracleRouter:
     """Routes claims to appropriate oracles based on domain."""
@@ -50,6 +65,7 @@ class OracleRouter:
         - general → LLMOracle
 
         Fallback logic:
+        - If domain.confidence < 0.3 → run LLMOracle only, as the general oracle
         - If domain.confidence < 0.6 → run LLMOracle as fallback
         - If primary oracle returns "uncertain" → run LLMOracle as fallback
 
@@ -61,8 +77,12 @@ class OracleRouter:
             Tuple of (oracle results list, routing decision)
         """
         # Choose primary oracle based on domain
-        primary_domain = domain.domain if domain.domain in self.registry else "general"
-        primary_oracle = self.registry[primary_domain]
+        # A single registry lookup; unknown domains route to the general oracle
+        primary_domain = domain.domain
+        primary_oracle = self.registry.get(primary_domain)
+        if primary_oracle is None or domain.confidence < SKIP_PRIMARY_THRESHOLD:
+            primary_domain = "general"
+            primary_oracle = self.llm_oracle
 
         results: list[OracleResult] = []
         primary_result = primary_oracle.analyze(claim, domain)
@@ -83,14 +103,23 @@ class OracleRouter:
         if needs_fallback and primary_domain != "general":
             fallback_used = True
             logger.debug(
-                f"Fallback triggered: domain_confidence={domain.confidence:.2f}, "
-                f"primary_verdict={primary_result.verdict}, primary_oracle={primary_domain}"
+                "Fallback triggered: domain_confidence=%.2f, primary_verdict=%s, primary_oracle=%s",
+                domain.confidence,
+                primary_result.verdict,
+                primary_domain,
             )
             fallback_result = self.llm_oracle.analyze(claim, domain)
             results.append(fallback_result)
 
-        routing = OracleRoutingDecision(
-            primary_oracle=primary_domain,
-            fallback_used=fallback_used,
-        )
-        return results, routing
+        return results, _ROUTING_DECISIONS[primary_domain, fallback_used]
+
+
+@lru_cache(maxsize=1)
+def get_oracle_router() -> OracleRouter:
+    """
+    Return the process-wide oracle router, creating it on first use.
+
+    Returns:
+        OracleRouter shared by all API endpoints
+    """
+    return OracleRouter()
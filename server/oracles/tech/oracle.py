@@ -12,6 +12,8 @@ from server.schemas.oracle_result import OracleResult
 class TechReleaseOracle(Oracle):
     """Stub oracle for tech release claims."""
 
+    __slots__ = ()
+
     name = "tech_release"
 
     def analyze(self, claim: Claim, domain: DomainResult) -> OracleResult:
@@ -29,6 +31,6 @@ class TechReleaseOracle(Oracle):
             oracle_name=self.name,
             verdict="uncertain",
             confidence=0.3,
-            evidence=[],
+            evidence=(),
             domain_context={"reason": "Tech release oracle not yet implemented"},
         )
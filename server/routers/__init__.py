@@ -4,6 +4,6 @@ Routers module for GroundZero API
 This module contains API route handlers.
 """
 
-from server.routers import check_claim
+from server.routers import check_claim, metrics
 
-__all__ = ["check_claim"]
+__all__ = ["check_claim", "metrics"]
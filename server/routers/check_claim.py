@@ -4,53 +4,289 @@ Check claim API router.
 Endpoints for parsing and classifying claims.
 """
 
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import datetime
+from typing import Any, Optional, Union
+from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 
 from server.ml.claim_extractor import extract_claim
 from server.ml.domain_classifier import classify_domain
 from server.oracles.aggregator import aggregate_oracle_results
-from server.oracles.router import OracleRouter
+from server.oracles.router import get_oracle_router
+from server.routers import metrics
 from server.schemas.aggregate_result import AggregateResult
-from server.schemas.claim import ParseClaimRequest, ParseClaimResponse
+from server.schemas.claim import (
+    Claim,
+    DomainResult,
+    ParseClaimBatchRequest,
+    ParseClaimRequest,
+    ParseClaimResponse,
+)
 
 router = APIRouter(prefix="/check_claim", tags=["check_claim"])
 logger = logging.getLogger(__name__)
 
-# Initialize the oracle router
-_oracle_router = OracleRouter()
+# Relative date hints ("today", "yesterday") resolve against the New York date
+_NY_TZ = ZoneInfo("America/New_York")
+
+
+class _ResultCache:
+    """Thread-safe LRU cache of recent endpoint results with a TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of results kept in memory
+            ttl: Seconds for which a result is reused
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return a cached result if it is still fresh.
+
+        Args:
+            key: Inputs the result was computed for
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, result: Any) -> None:
+        """
+        Store a result, evicting the least recently used one when full.
+
+        Args:
+            key: Inputs the result was computed for
+            result: The result; shared between callers and must not be mutated
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Repeated claims (retries, popular claims) skip extraction and classification, and
+# repeated checks skip the whole pipeline. Checks are keyed by (text, New York date).
+_parse_cache = _ResultCache(maxsize=10000)
+_check_cache = _ResultCache()
+
+# /parse is a pure function of the claim text, so a client may reuse a response for
+# as long as the server-side parse cache would. Shared caches never store POST
+# responses, so this is only a hint to the calling client.
+_PARSE_CACHE_CONTROL = f"private, max-age={int(_parse_cache.ttl)}"
+
+# Mixed into /parse ETags. Bump it whenever extraction or classification output for
+# the same text changes, so clients revalidating an old tag get the new parse
+_PARSE_VERSION = "1"
+
+
+def _parse(claim_text: str) -> tuple[Claim, DomainResult]:
+    """
+    Extract and classify a claim.
+
+    Args:
+        claim_text: The raw claim text
+
+    Returns:
+        Tuple of (extracted claim, domain classification)
+    """
+    cached = _parse_cache.get(claim_text)
+    if cached is not None:
+        metrics.parse_cache_hits.inc()
+        return cached
+    metrics.parse_cache_misses.inc()
+
+    # Extract claim information
+    claim = extract_claim(claim_text)
+    # Only dump the claim when debug logging will actually emit it
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Extracted: %s", claim.model_dump_json())
+
+    # Classify domain
+    domain = classify_domain(claim_text, claim)
+    logger.debug("Domain classified as: %s", domain)
+
+    _parse_cache.put(claim_text, (claim, domain))
+    return claim, domain
+
+
+def _parse_batch(claim_texts: list[str]) -> list[tuple[Claim, DomainResult]]:
+    """
+    Extract and classify several claims.
+
+    Args:
+        claim_texts: The raw claim texts
+
+    Returns:
+        (extracted claim, domain classification) for each text, in order
+    """
+    return [_parse(claim_text) for claim_text in claim_texts]
+
+
+def _parse_etag(claim_text: str) -> str:
+    """
+    Compute the strong entity tag of a /parse response.
+
+    Args:
+        claim_text: The raw claim text
+
+    Returns:
+        Quoted SHA-256 hex digest of the parser version and claim text
+    """
+    digest = hashlib.sha256(f"{_PARSE_VERSION}\0{claim_text}".encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Check an If-None-Match header against an entity tag.
+
+    Args:
+        etag: The current entity tag
+        if_none_match: Raw If-None-Match header value, if any
+
+    Returns:
+        True if the client already holds the current representation
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so a W/ prefix on the client's tag is ignored
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _check(claim_text: str) -> AggregateResult:
+    """
+    Run the full fact-checking pipeline on a claim.
+
+    Args:
+        claim_text: The raw claim text
+
+    Returns:
+        AggregateResult with final verdict, confidence, and supporting evidence
+    """
+    # The date is part of the key so "today" claims are re-checked once the day changes
+    cache_key = (claim_text, datetime.now(_NY_TZ).date())
+    cached = _check_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("Returning cached result")
+        return cached
+
+    # Steps 1-2: Parse claim and classify domain
+    claim, domain = _parse(claim_text)
+
+    # Step 3: Route to oracle(s)
+    oracle_results, routing = get_oracle_router().run(claim, domain)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Oracle routing: %s", routing.model_dump_json())
+        logger.debug("Oracle results: %s", [r.oracle_name for r in oracle_results])
+
+    # Step 4: Aggregate results
+    aggregate_result = aggregate_oracle_results(oracle_results, claim, domain)
+    _check_cache.put(cache_key, aggregate_result)
+    return aggregate_result
 
 
 @router.post("/parse", response_model=ParseClaimResponse)
-async def parse_claim(request: ParseClaimRequest) -> ParseClaimResponse:
+async def parse_claim(
+    request: ParseClaimRequest,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+) -> Union[ParseClaimResponse, Response]:
     """
     Parse and classify a claim.
 
     Extracts structured information from the claim text and classifies it
-    into a domain (finance, tech_release, or general).
+    into a domain (finance, tech_release, or general). Responses carry an ETag
+    derived from the claim text; a matching If-None-Match gets a 304.
+
+    RFC 9110 section 13.1.2 says a failed If-None-Match on POST should get a 412.
+    /parse has no side effects, so it deliberately answers 304 instead, letting
+    clients revalidate a parse the same way they would a GET.
 
     Args:
         request: ParseClaimRequest containing the claim text
+        response: Response whose headers are set on success
+        if_none_match: Entity tags the client already holds
 
     Returns:
-        ParseClaimResponse with extracted claim and domain classification
+        ParseClaimResponse with extracted claim and domain classification,
+        or an empty 304 response if the client's copy is current
     """
-    # Validate input
-    if not request.claim_text.strip():
+    # Validate input (isspace() checks in place instead of allocating a stripped copy)
+    if not request.claim_text or request.claim_text.isspace():
         raise HTTPException(status_code=400, detail="Claim text cannot be empty.")
 
-    logger.info(f"Received claim: {request.claim_text[:80]}")
+    with metrics.parse_latency_seconds.time():
+        etag = _parse_etag(request.claim_text)
+        headers = {"ETag": etag, "Cache-Control": _PARSE_CACHE_CONTROL}
+        if _etag_matches(etag, if_none_match):
+            return Response(status_code=304, headers=headers)
 
-    # Extract claim information
-    claim = extract_claim(request.claim_text)
-    logger.debug(f"Extracted: {claim.model_dump()}")
+        logger.info("Received claim: %s", request.claim_text[:80])
 
-    # Classify domain
-    domain = classify_domain(request.claim_text, claim)
-    logger.debug(f"Domain classified as: {domain}")
+        # Extraction and classification are CPU-bound (and the first classification
+        # fits the TF-IDF model), so run them off the event loop
+        claim, domain = await run_in_threadpool(_parse, request.claim_text)
+
+        response.headers.update(headers)
+        # Both parts are already validated models, so skip re-validating them
+        return ParseClaimResponse.model_construct(claim=claim, domain=domain)
+
+
+@router.post("/parse_batch", response_model=list[ParseClaimResponse])
+async def parse_claim_batch(request: ParseClaimBatchRequest) -> list[ParseClaimResponse]:
+    """
+    Parse and classify several claims in one request.
+
+    Args:
+        request: ParseClaimBatchRequest containing the claim texts
+
+    Returns:
+        ParseClaimResponse for each claim text, in request order
+    """
+    # Validate input
+    if any(not text or text.isspace() for text in request.claim_texts):
+        raise HTTPException(status_code=400, detail="Claim text cannot be empty.")
 
-    return ParseClaimResponse(claim=claim, domain=domain)
+    logger.info("Received batch of %d claims", len(request.claim_texts))
+
+    # One threadpool hop for the whole batch; repeated texts are served by the caches
+    parsed = await run_in_threadpool(_parse_batch, request.claim_texts)
+
+    return [
+        ParseClaimResponse.model_construct(claim=claim, domain=domain) for claim, domain in parsed
+    ]
 
 
 @router.post("/check", response_model=AggregateResult)
@@ -71,29 +307,20 @@ async def check_claim(request: ParseClaimRequest) -> AggregateResult:
         AggregateResult with final verdict, confidence, and supporting evidence
     """
     # Validate input
-    if not request.claim_text.strip():
+    if not request.claim_text or request.claim_text.isspace():
         raise HTTPException(status_code=400, detail="Claim text cannot be empty.")
 
-    logger.info(f"Checking claim: {request.claim_text[:80]}")
-
-    # Step 1: Parse claim
-    claim = extract_claim(request.claim_text)
-    logger.debug(f"Extracted: {claim.model_dump()}")
+    logger.info("Checking claim: %s", request.claim_text[:80])
 
-    # Step 2: Classify domain
-    domain = classify_domain(request.claim_text, claim)
-    logger.debug(f"Domain classified as: {domain}")
-
-    # Step 3: Route to oracle(s)
-    oracle_results, routing = _oracle_router.run(claim, domain)
-    logger.debug(f"Oracle routing: {routing.model_dump()}")
-    logger.debug(f"Oracle results: {[r.oracle_name for r in oracle_results]}")
-
-    # Step 4: Aggregate results
-    aggregate_result = aggregate_oracle_results(oracle_results, claim, domain)
+    # The whole pipeline is synchronous CPU and file work; run it in one threadpool
+    # hop so the event loop stays free for other requests. Classification takes the
+    # extracted claim, so the steps stay sequential within the worker thread.
+    aggregate_result = await run_in_threadpool(_check, request.claim_text)
     logger.info(
-        f"Final verdict: {aggregate_result.final_verdict} "
-        f"(confidence: {aggregate_result.final_confidence:.2f})"
+        "Final verdict: %s (confidence: %.2f)",
+        aggregate_result.final_verdict,
+        aggregate_result.final_confidence,
     )
+    metrics.record_verdict(aggregate_result.final_verdict)
 
     return aggregate_result
@@ -0,0 +1,190 @@
+"""
+Metrics API router.
+
+Exposes parse cache and verdict counters and parse latency in the Prometheus text format.
+"""
+
+import bisect
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+router = APIRouter(tags=["metrics"])
+
+# Upper bounds in seconds of the latency histogram buckets (Prometheus client defaults)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0)
+
+
+class _PerThreadCells:
+    """
+    Per-thread storage for lock-free metrics.
+
+    Each thread updates only its own cell, so recording a value never takes a lock
+    and never races with another writer. Readers sum over every thread's cell. The
+    lock is only taken the first time a thread records a value, to register its cell.
+    """
+
+    def __init__(self, size: int):
+        """
+        Initialize with no cells.
+
+        Args:
+            size: Number of slots in each thread's cell
+        """
+        self._size = size
+        self._local = threading.local()
+        self._cells: list[list] = []
+        self._register_lock = threading.Lock()
+
+    def _cell(self) -> list:
+        """Return this thread's cell, registering it on first use."""
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = [0] * self._size
+            with self._register_lock:
+                self._cells.append(cell)
+            self._local.cell = cell
+            return cell
+
+    def _totals(self) -> list:
+        """Sum each slot over all threads' cells."""
+        with self._register_lock:
+            cells = list(self._cells)
+        return [sum(values) for values in zip(*cells)] if cells else [0] * self._size
+
+
+class Counter(_PerThreadCells):
+    """Monotonic counter, incremented from threadpool workers without a lock."""
+
+    def __init__(self):
+        """Initialize the counter at zero."""
+        super().__init__(1)
+
+    def inc(self) -> None:
+        """Increment the counter by one."""
+        self._cell()[0] += 1
+
+    @property
+    def value(self) -> int:
+        """Current count, summed over all threads."""
+        return self._totals()[0]
+
+
+class Histogram(_PerThreadCells):
+    """Distribution of observed values over fixed buckets, in the Prometheus style."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets: Increasing upper bounds of the buckets; a +Inf bucket is implied
+        """
+        self.buckets = tuple(buckets)
+        # Per-bucket (not cumulative) counts, a slot for the +Inf bucket, then the sum
+        super().__init__(len(self.buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value: The observed value
+        """
+        cell = self._cell()
+        # Buckets are inclusive upper bounds, so a value equal to a bound goes in it
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall-clock seconds spent in the with block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> tuple[list[int], float]:
+        """
+        Read the histogram, summed over all threads.
+
+        Returns:
+            Tuple of (cumulative count per bucket including +Inf, sum of observations)
+        """
+        totals = self._totals()
+        cumulative = []
+        running = 0
+        for count in totals[:-1]:
+            running += count
+            cumulative.append(running)
+        return cumulative, float(totals[-1])
+
+
+parse_cache_hits = Counter()
+parse_cache_misses = Counter()
+parse_latency_seconds = Histogram()
+
+# Final verdicts the aggregator can return, counted from zero so each series exists
+# before its first request
+VERDICTS = ("likely_true", "likely_false", "uncertain")
+
+# Keyed by final verdict. Any other verdict gets a counter on first use;
+# dict.setdefault is atomic for str keys, so that needs no separate lock
+_verdict_counters: dict[str, Counter] = {verdict: Counter() for verdict in VERDICTS}
+
+
+def record_verdict(verdict: str) -> None:
+    """
+    Count one aggregated verdict.
+
+    Args:
+        verdict: The final verdict returned to the client
+    """
+    counter = _verdict_counters.get(verdict)
+    if counter is None:
+        counter = _verdict_counters.setdefault(verdict, Counter())
+    counter.inc()
+
+
+def render_metrics() -> str:
+    """
+    Render all counters in the Prometheus text exposition format.
+
+    Returns:
+        The metrics page body
+    """
+    lines = [
+        "# TYPE parse_cache_hits_total counter",
+        f"parse_cache_hits_total {parse_cache_hits.value}",
+        "# TYPE parse_cache_misses_total counter",
+        f"parse_cache_misses_total {parse_cache_misses.value}",
+        "# TYPE check_verdicts_total counter",
+    ]
+    for verdict, counter in sorted(_verdict_counters.items()):
+        lines.append(f'check_verdicts_total{{verdict="{verdict}"}} {counter.value}')
+
+    cumulative, total = parse_latency_seconds.snapshot()
+    lines.append("# TYPE parse_latency_seconds histogram")
+    for bound, count in zip(parse_latency_seconds.buckets, cumulative):
+        lines.append(f'parse_latency_seconds_bucket{{le="{bound}"}} {count}')
+    lines.append(f'parse_latency_seconds_bucket{{le="+Inf"}} {cumulative[-1]}')
+    lines.append(f"parse_latency_seconds_sum {total}")
+    lines.append(f"parse_latency_seconds_count {cumulative[-1]}")
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> str:
+    """
+    Prometheus scrape endpoint.
+
+    Returns:
+        Counter values in the Prometheus text exposition format
+    """
+    return render_metrics()
@@ -5,16 +5,12 @@ Endpoints for running oracles on parsed claims.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
-from server.oracles.router import OracleRouter
-from server.schemas.claim import Claim, DomainResult  # noqa: F401
+from server.oracles.router import get_oracle_router
 from server.schemas.oracle_result import RunOraclesRequest, RunOraclesResponse
 
-# Rebuild RunOraclesRequest to resolve forward references
-RunOraclesRequest.model_rebuild()
-
 router = APIRouter(prefix="/check_claim", tags=["check_claim"])
-_oracle_router = OracleRouter()
 
 
 @router.post("/oracles", response_model=RunOraclesResponse)
@@ -32,5 +28,7 @@ async def run_oracles(req: RunOraclesRequest) -> RunOraclesResponse:
     """
     if not req.claim or not req.domain:
         raise HTTPException(status_code=400, detail="Missing claim or domain")
-    results, routing = _oracle_router.run(req.claim, req.domain)
-    return RunOraclesResponse(results=results, routing=routing)
+    # Oracles read price and news files, so keep them off the event loop
+    results, routing = await run_in_threadpool(get_oracle_router().run, req.claim, req.domain)
+    # Results and routing come from the router as validated models; skip re-validation
+    return RunOraclesResponse.model_construct(results=results, routing=routing)
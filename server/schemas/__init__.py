@@ -4,7 +4,14 @@ Schemas module for GroundZero API
 Contains Pydantic models for request/response validation.
 """
 
-from server.schemas.claim import Claim, DomainResult, ParseClaimRequest, ParseClaimResponse
+from server.schemas.aggregate_result import AggregateResult, OracleCallResult
+from server.schemas.claim import (
+    Claim,
+    DomainResult,
+    ParseClaimBatchRequest,
+    ParseClaimRequest,
+    ParseClaimResponse,
+)
 from server.schemas.oracle_result import (
     EvidenceItem,
     OracleResult,
@@ -17,10 +24,13 @@ __all__ = [
     "Claim",
     "DomainResult",
     "ParseClaimRequest",
+    "ParseClaimBatchRequest",
     "ParseClaimResponse",
     "EvidenceItem",
     "OracleResult",
     "OracleRoutingDecision",
     "RunOraclesRequest",
     "RunOraclesResponse",
+    "AggregateResult",
+    "OracleCallResult",
 ]
@@ -2,24 +2,30 @@
 Claim-related Pydantic models for the GroundZero API.
 """
 
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Longest accepted claim text; longer payloads are rejected during validation, before
+# any extraction or classification work is done
+MAX_CLAIM_LENGTH = 4096
+
+ClaimText = Annotated[str, Field(max_length=MAX_CLAIM_LENGTH)]
 
 
 class Claim(BaseModel):
     """Model representing an extracted claim with metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     raw: str = Field(..., description="Original raw text of the claim")
-    tickers: list[str] = Field(
-        default_factory=list, description="List of extracted stock tickers (e.g., AAPL, TSLA)"
-    )
-    companies: list[str] = Field(
-        default_factory=list, description="List of extracted company names"
-    )
-    percentages: list[float] = Field(
-        default_factory=list, description="List of extracted percentage values"
+    # Tuples rather than lists: parsed claims are cached and shared between requests,
+    # so their fields must not be mutable
+    tickers: tuple[str, ...] = Field(
+        (), description="List of extracted stock tickers (e.g., AAPL, TSLA)"
     )
+    companies: tuple[str, ...] = Field((), description="List of extracted company names")
+    percentages: tuple[float, ...] = Field((), description="List of extracted percentage values")
     date_hint: Optional[str] = Field(
         None, description="Detected date hint (e.g., 'today', 'yesterday')"
     )
@@ -31,6 +37,8 @@ class Claim(BaseModel):
 class DomainResult(BaseModel):
     """Model representing the domain classification result."""
 
+    model_config = ConfigDict(frozen=True)
+
     domain: str = Field(..., description="Classified domain (finance, tech_release, general)")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score (0.0 to 1.0)")
 
@@ -38,11 +46,27 @@ class DomainResult(BaseModel):
 class ParseClaimRequest(BaseModel):
     """Request model for the /check_claim/parse endpoint."""
 
-    claim_text: str = Field(..., description="The claim text to parse and classify")
+    model_config = ConfigDict(frozen=True)
+
+    claim_text: str = Field(
+        ..., max_length=MAX_CLAIM_LENGTH, description="The claim text to parse and classify"
+    )
+
+
+class ParseClaimBatchRequest(BaseModel):
+    """Request model for the /check_claim/parse_batch endpoint."""
+
+    model_config = ConfigDict(frozen=True)
+
+    claim_texts: list[ClaimText] = Field(
+        ..., min_length=1, max_length=100, description="The claim texts to parse and classify"
+    )
 
 
 class ParseClaimResponse(BaseModel):
     """Response model for the /check_claim/parse endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     claim: Claim = Field(..., description="Extracted claim information")
     domain: DomainResult = Field(..., description="Domain classification result")
@@ -4,17 +4,18 @@ Oracle result schemas for GroundZero API.
 Defines models for oracle-based fact checking results.
 """
 
-from typing import TYPE_CHECKING, Literal, Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-if TYPE_CHECKING:
-    from server.schemas.claim import Claim, DomainResult
+from server.schemas.claim import Claim, DomainResult
 
 
 class EvidenceItem(BaseModel):
     """Model representing a piece of evidence from an oracle."""
 
+    model_config = ConfigDict(frozen=True)
+
     source: str = Field(..., description="Source name or type (e.g., 'Company Blog', 'EDGAR')")
     title: Optional[str] = Field(None, description="Title or short label for the evidence")
     url: Optional[str] = Field(None, description="Canonical URL to the evidence, if any")
@@ -27,6 +28,8 @@ class EvidenceItem(BaseModel):
 class OracleResult(BaseModel):
     """Model representing the result from an oracle."""
 
+    model_config = ConfigDict(frozen=True)
+
     oracle_name: str = Field(
         ...,
         description=(
@@ -35,7 +38,8 @@ class OracleResult(BaseModel):
     )
     verdict: Literal["likely_true", "likely_false", "uncertain", "unsupported"] = "unsupported"
     confidence: float = Field(0.0, ge=0.0, le=1.0)
-    evidence: list[EvidenceItem] = Field(default_factory=list)
+    # Immutable, so the default is one shared empty tuple rather than a new list per result
+    evidence: tuple[EvidenceItem, ...] = ()
     domain_context: Optional[dict] = Field(
         default=None, description="Domain-specific metrics/context"
     )
@@ -44,6 +48,8 @@ class OracleResult(BaseModel):
 class OracleRoutingDecision(BaseModel):
     """Model representing the routing decision made by the oracle router."""
 
+    model_config = ConfigDict(frozen=True)
+
     primary_oracle: Literal["finance", "tech_release", "general"]
     fallback_used: bool = False
 
@@ -51,12 +57,16 @@ class OracleRoutingDecision(BaseModel):
 class RunOraclesRequest(BaseModel):
     """Request model for running oracles on a claim."""
 
-    claim: "Claim"
-    domain: "DomainResult"
+    model_config = ConfigDict(frozen=True)
+
+    claim: Claim
+    domain: DomainResult
 
 
 class RunOraclesResponse(BaseModel):
     """Response model for oracle results."""
 
+    model_config = ConfigDict(frozen=True)
+
     results: list[OracleResult]
     routing: OracleRoutingDecision
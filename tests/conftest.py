@@ -0,0 +1,37 @@
+"""
+Shared pytest fixtures.
+"""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from server.main import app
+from server.ml.domain_classifier import DomainClassifier, SemanticDomainClassifier
+
+
+@pytest.fixture(scope="session")
+def semantic_classifier():
+    """Semantic classifier with the default threshold, fit once per session."""
+    return SemanticDomainClassifier()
+
+
+@pytest.fixture(scope="session")
+def domain_classifier():
+    """Domain classifier shared across tests."""
+    return DomainClassifier()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client whose app lifespan is entered once per session."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+async def async_client():
+    """Async client calling the app in-process over ASGI, shared by the session."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
@@ -2,18 +2,22 @@
 Tests for the check_claim API endpoint.
 """
 
-import pytest
-from fastapi.testclient import TestClient
+from concurrent.futures import ThreadPoolExecutor
 
-from server.main import app
+import pytest
 
-client = TestClient(app)
+from server.ml.claim_extractor import extract_claim
+from server.ml.domain_classifier import classify_domain
+from server.routers import check_claim as check_claim_module
+from server.routers import metrics
+from server.routers.check_claim import _parse_cache
+from server.schemas.claim import MAX_CLAIM_LENGTH, ParseClaimResponse
 
 
 class TestCheckClaimAPI:
     """Test cases for /check_claim endpoints."""
 
-    def test_parse_claim_finance(self):
+    def test_parse_claim_finance(self, client):
         """Test parsing a finance-related claim."""
         response = client.post("/check_claim/parse", json={"claim_text": "AAPL rose 10% today"})
         assert response.status_code == 200
@@ -34,7 +38,7 @@ class TestCheckClaimAPI:
         assert domain["domain"] == "finance"
         assert 0.0 <= domain["confidence"] <= 1.0
 
-    def test_parse_claim_tech(self):
+    def test_parse_claim_tech(self, client):
         """Test parsing a tech-related claim."""
         response = client.post(
             "/check_claim/parse",
@@ -56,7 +60,7 @@ class TestCheckClaimAPI:
         domain = data["domain"]
         assert domain["domain"] == "tech_release"
 
-    def test_parse_claim_general(self):
+    def test_parse_claim_general(self, client):
         """Test parsing a general claim."""
         response = client.post(
             "/check_claim/parse", json={"claim_text": "This is just a statement"}
@@ -77,7 +81,7 @@ class TestCheckClaimAPI:
         domain = data["domain"]
         assert domain["domain"] == "general"
 
-    def test_parse_claim_multiple_tickers(self):
+    def test_parse_claim_multiple_tickers(self, client):
         """Test parsing claim with multiple tickers."""
         response = client.post(
             "/check_claim/parse",
@@ -92,12 +96,12 @@ class TestCheckClaimAPI:
         assert 5.0 in claim["percentages"]
         assert claim["date_hint"] == "this morning"
 
-    def test_parse_claim_missing_field(self):
+    def test_parse_claim_missing_field(self, client):
         """Test that missing claim_text returns error."""
         response = client.post("/check_claim/parse", json={})
         assert response.status_code == 422  # Validation error
 
-    def test_parse_claim_empty_text(self):
+    def test_parse_claim_empty_text(self, client):
         """Test parsing empty claim text returns validation error."""
         response = client.post("/check_claim/parse", json={"claim_text": ""})
         assert response.status_code == 400  # Bad request for empty text
@@ -105,7 +109,16 @@ class TestCheckClaimAPI:
         assert "detail" in data
         assert "empty" in data["detail"].lower()
 
-    def test_response_structure(self):
+    def test_parse_claim_too_long(self, client):
+        """Test that claim text over the length limit returns validation error."""
+        text = "A" * (MAX_CLAIM_LENGTH + 1)
+        response = client.post("/check_claim/parse", json={"claim_text": text})
+        assert response.status_code == 422
+
+        response = client.post("/check_claim/parse_batch", json={"claim_texts": ["AAPL", text]})
+        assert response.status_code == 422
+
+    def test_response_structure(self, client):
         """Test that response has correct structure."""
         response = client.post("/check_claim/parse", json={"claim_text": "Test claim"})
         assert response.status_code == 200
@@ -129,7 +142,7 @@ class TestCheckClaimAPI:
         assert "domain" in domain
         assert "confidence" in domain
 
-    def test_parse_claim_complex(self):
+    def test_parse_claim_complex(self, client):
         """Test parsing a complex claim with multiple features."""
         text = "Tesla and NVIDIA stock prices surged 15% and 20% today after both announced new releases"
         response = client.post("/check_claim/parse", json={"claim_text": text})
@@ -142,3 +155,170 @@ class TestCheckClaimAPI:
         assert claim["date_hint"] == "today"
         # Could be either finance or tech_release depending on which rules match first
         assert data["domain"]["domain"] in ["finance", "tech_release"]
+
+    def test_parse_claim_matches_validated_response(self, client):
+        """Test that the unvalidated response serializes like a fully validated one."""
+        text = "NVDA jumped 7% this morning"
+        response = client.post("/check_claim/parse", json={"claim_text": text})
+        assert response.status_code == 200
+
+        claim = extract_claim(text)
+        expected = ParseClaimResponse(claim=claim, domain=classify_domain(text, claim))
+        assert response.json() == expected.model_dump(mode="json")
+
+    def test_parse_claim_repeat_is_cached(self, client, monkeypatch):
+        """Test that a repeated claim reuses the cached parse without re-extracting."""
+        _parse_cache.clear()
+        text = "TSLA fell 2% yesterday"
+        first = client.post("/check_claim/parse", json={"claim_text": text})
+        assert first.status_code == 200
+
+        def fail_extract(claim_text):
+            raise AssertionError("claims should not be re-extracted once cached")
+
+        monkeypatch.setattr(check_claim_module, "extract_claim", fail_extract)
+        second = client.post("/check_claim/parse", json={"claim_text": text})
+
+        assert second.status_code == 200
+        assert second.json() == first.json()
+
+    def test_cached_results_are_immutable(self):
+        """Test that parse and check results shared through the caches cannot be mutated."""
+        claim, _domain = check_claim_module._parse("NVDA jumped 4% today")
+        with pytest.raises(AttributeError):
+            claim.tickers.append("AAPL")
+
+        result = check_claim_module._check("NVDA jumped 4% today")
+        with pytest.raises(AttributeError):
+            result.oracle_calls.append(result.oracle_calls[0])
+        with pytest.raises(AttributeError):
+            result.oracle_calls[0].evidence.append(None)
+
+    def test_parse_claim_etag(self, client):
+        """Test that /parse sets a content-derived ETag and honours If-None-Match."""
+        text = "NVDA jumped 8% this morning"
+        first = client.post("/check_claim/parse", json={"claim_text": text})
+        etag = first.headers["ETag"]
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"].startswith("private, max-age=")
+
+        cached = client.post(
+            "/check_claim/parse", json={"claim_text": text}, headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+
+        other = client.post(
+            "/check_claim/parse",
+            json={"claim_text": "TSLA fell 2% yesterday"},
+            headers={"If-None-Match": etag},
+        )
+        assert other.status_code == 200
+        assert other.headers["ETag"] != etag
+
+    def test_parse_claim_etag_changes_with_parser_version(self, client, monkeypatch):
+        """Test that a parser version bump invalidates tags issued by the old parser."""
+        text = "NVDA jumped 8% this morning"
+        etag = client.post("/check_claim/parse", json={"claim_text": text}).headers["ETag"]
+
+        monkeypatch.setattr(check_claim_module, "_PARSE_VERSION", "test-next")
+        response = client.post(
+            "/check_claim/parse", json={"claim_text": text}, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_parse_claim_batch(self, client):
+        """Test that batch parsing returns the same result as parsing each claim."""
+        texts = ["AAPL rose 10% today", "Apple announced a new iPhone", "AAPL rose 10% today"]
+        response = client.post("/check_claim/parse_batch", json={"claim_texts": texts})
+        assert response.status_code == 200
+        data = response.json()
+
+        assert len(data) == len(texts)
+        for text, result in zip(texts, data):
+            single = client.post("/check_claim/parse", json={"claim_text": text})
+            assert result == single.json()
+
+    def test_parse_claim_batch_rejects_empty_text(self, client):
+        """Test that a batch containing an empty claim is rejected."""
+        response = client.post("/check_claim/parse_batch", json={"claim_texts": ["AAPL", " "]})
+        assert response.status_code == 400
+
+    def test_parse_claim_batch_rejects_empty_list(self, client):
+        """Test that an empty batch returns a validation error."""
+        response = client.post("/check_claim/parse_batch", json={"claim_texts": []})
+        assert response.status_code == 422
+
+
+class TestMetricsAPI:
+    """Test cases for the /metrics endpoint."""
+
+    def test_counter(self):
+        """Test that a counter reports increments without advancing on read."""
+        counter = metrics.Counter()
+        assert counter.value == 0
+        counter.inc()
+        counter.inc()
+        assert counter.value == 2
+        assert counter.value == 2
+
+    def test_counter_sums_across_threads(self):
+        """Test that increments from many threads are all counted."""
+        counter = metrics.Counter()
+
+        def increment(_):
+            for _ in range(1000):
+                counter.inc()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(increment, range(8)))
+
+        assert counter.value == 8000
+
+    def test_histogram(self):
+        """Test that observations land in cumulative buckets with a running sum."""
+        histogram = metrics.Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        cumulative, total = histogram.snapshot()
+        assert cumulative == [2, 3, 4]
+        assert total == pytest.approx(3.65)
+
+    def test_parse_latency_histogram(self, client):
+        """Test that /parse requests are timed and exposed as a histogram."""
+        count = metrics.parse_latency_seconds.snapshot()[0][-1]
+        client.post("/check_claim/parse", json={"claim_text": "TSLA fell 3% yesterday"})
+
+        assert metrics.parse_latency_seconds.snapshot()[0][-1] == count + 1
+        page = client.get("/metrics").text
+        assert "# TYPE parse_latency_seconds histogram" in page
+        assert f'parse_latency_seconds_bucket{{le="+Inf"}} {count + 1}' in page
+        assert f"parse_latency_seconds_count {count + 1}" in page
+
+    def test_parse_cache_counters(self, client):
+        """Test that parse cache hits and misses are exposed."""
+        _parse_cache.clear()
+        hits, misses = metrics.parse_cache_hits.value, metrics.parse_cache_misses.value
+        text = "META surged 6% last week"
+        client.post("/check_claim/parse", json={"claim_text": text})
+        client.post("/check_claim/parse", json={"claim_text": text})
+
+        assert metrics.parse_cache_misses.value == misses + 1
+        assert metrics.parse_cache_hits.value == hits + 1
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert f"parse_cache_hits_total {hits + 1}" in response.text
+
+    def test_verdict_counter(self, client):
+        """Test that /check verdicts are counted by label."""
+        response = client.post("/check_claim/check", json={"claim_text": "AAPL rose 10% today"})
+        verdict = response.json()["final_verdict"]
+
+        page = client.get("/metrics").text
+        assert f'check_verdicts_total{{verdict="{verdict}"}} ' in page
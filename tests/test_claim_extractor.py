@@ -55,6 +55,12 @@ class TestClaimExtractor:
         companies = ClaimExtractor.extract_companies(text)
         assert "Apple" in companies
 
+    def test_extract_companies_no_duplicates(self):
+        """Test that repeated company mentions are returned once in canonical case."""
+        text = "Tesla beat estimates and TESLA shares reacted"
+        companies = ClaimExtractor.extract_companies(text)
+        assert companies == ["Tesla"]
+
     def test_extract_percentages_simple(self):
         """Test extracting simple percentage."""
         text = "Stock rose 10%"
@@ -98,6 +104,12 @@ class TestClaimExtractor:
         date_hint = ClaimExtractor.extract_date_hint(text)
         assert date_hint == "this morning"
 
+    def test_extract_date_hint_priority(self):
+        """Test that the highest priority hint wins regardless of position in the text."""
+        text = "Stock fell yesterday but recovered today"
+        date_hint = ClaimExtractor.extract_date_hint(text)
+        assert date_hint == "today"
+
     def test_extract_date_hint_none(self):
         """Test when no date hint is present."""
         text = "Stock is trading"
@@ -116,6 +128,18 @@ class TestClaimExtractor:
         event_type = ClaimExtractor.determine_event_type(text)
         assert event_type == "tech_release"
 
+    def test_determine_event_type_price_takes_precedence(self):
+        """Test that price movement wins even when a tech keyword appears first."""
+        text = "Apple announced earnings and the stock jumped"
+        event_type = ClaimExtractor.determine_event_type(text)
+        assert event_type == "price_movement"
+
+    def test_determine_event_type_requires_whole_word(self):
+        """Test that keywords embedded in longer words do not set an event type."""
+        text = "The company resurged after a sunrise meeting"
+        event_type = ClaimExtractor.determine_event_type(text)
+        assert event_type is None
+
     def test_determine_event_type_none(self):
         """Test when no event type can be determined."""
         text = "This is just a statement"
@@ -151,3 +175,28 @@ class TestClaimExtractor:
         assert len(claim.percentages) == 0
         assert claim.date_hint is None
         assert claim.event_type is None
+
+    def test_extract_claim_lowercase_text(self):
+        """Test that all-lowercase text skips ticker extraction but keeps other fields."""
+        text = "apple jumped 4% yesterday"
+        claim = extract_claim(text)
+        assert claim.tickers == ()
+        assert claim.companies == ("Apple",)
+        assert claim.percentages == (4.0,)
+        assert claim.date_hint == "yesterday"
+        assert claim.event_type == "price_movement"
+
+    def test_extract_claim_long_input(self):
+        """Test that the request length cap does not apply to extraction itself."""
+        text = "AAPL rose 5% today. " * 300
+        claim = extract_claim(text)
+        assert claim.raw == text
+        assert claim.tickers == ("AAPL",)
+
+    def test_extract_claim_short_input(self):
+        """Test that inputs too short to contain anything return an empty claim."""
+        claim = extract_claim("A")
+        assert claim.raw == "A"
+        assert claim.tickers == ()
+        assert claim.percentages == ()
+        assert claim.date_hint is None
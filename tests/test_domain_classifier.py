@@ -2,58 +2,57 @@
 Tests for the domain classification module.
 """
 
-from server.ml.domain_classifier import DomainClassifier, SemanticDomainClassifier, classify_domain
+from server.ml.domain_classifier import (
+    DomainClassifier,
+    SemanticDomainClassifier,
+    _classify_cached,
+    classify_domain,
+)
 from server.schemas.claim import Claim
 
 
 class TestSemanticDomainClassifier:
     """Test cases for SemanticDomainClassifier class."""
 
-    def test_classify_finance_market_related(self):
+    def test_classify_finance_market_related(self, semantic_classifier):
         """Test classification of finance domain with market-related text."""
-        classifier = SemanticDomainClassifier()
         text = "The stock market experienced significant price movements today"
-        result = classifier.classify(text)
+        result = semantic_classifier.classify(text)
         assert result.domain == "finance"
         assert 0.0 <= result.confidence <= 1.0
 
-    def test_classify_finance_trading(self):
+    def test_classify_finance_trading(self, semantic_classifier):
         """Test classification of finance domain with trading text."""
-        classifier = SemanticDomainClassifier()
         text = "Bitcoin trading volume surged as prices rose"
-        result = classifier.classify(text)
+        result = semantic_classifier.classify(text)
         assert result.domain == "finance"
         assert 0.0 <= result.confidence <= 1.0
 
-    def test_classify_tech_release_announcement(self):
+    def test_classify_tech_release_announcement(self, semantic_classifier):
         """Test classification of tech release domain with announcement."""
-        classifier = SemanticDomainClassifier()
         text = "Company announces major product launch next month"
-        result = classifier.classify(text)
+        result = semantic_classifier.classify(text)
         assert result.domain == "tech_release"
         assert 0.0 <= result.confidence <= 1.0
 
-    def test_classify_tech_release_press(self):
+    def test_classify_tech_release_press(self, semantic_classifier):
         """Test classification of tech release domain with press release."""
-        classifier = SemanticDomainClassifier()
         text = "Tech giant releases new software update for users"
-        result = classifier.classify(text)
+        result = semantic_classifier.classify(text)
         assert result.domain == "tech_release"
         assert 0.0 <= result.confidence <= 1.0
 
-    def test_classify_general_facts(self):
+    def test_classify_general_facts(self, semantic_classifier):
         """Test classification of general domain with factual information."""
-        classifier = SemanticDomainClassifier()
         text = "The capital of France is Paris"
-        result = classifier.classify(text)
+        result = semantic_classifier.classify(text)
         assert result.domain == "general"
         assert 0.0 <= result.confidence <= 1.0
 
-    def test_classify_general_scientific(self):
+    def test_classify_general_scientific(self, semantic_classifier):
         """Test classification of general domain with scientific claim."""
-        classifier = SemanticDomainClassifier()
         text = "Water molecules consist of hydrogen and oxygen atoms"
-        result = classifier.classify(text)
+        result = semantic_classifier.classify(text)
         assert result.domain == "general"
         assert 0.0 <= result.confidence <= 1.0
 
@@ -64,20 +63,18 @@ class TestSemanticDomainClassifier:
         result = classifier.classify(text)
         assert result.domain == "general"
 
-    def test_confidence_range(self):
+    def test_confidence_range(self, semantic_classifier):
         """Test that confidence values are within valid range."""
-        classifier = SemanticDomainClassifier()
         text = "Stock prices fell today"
-        result = classifier.classify(text)
+        result = semantic_classifier.classify(text)
         assert 0.0 <= result.confidence <= 1.0
 
 
 class TestDomainClassifier:
     """Test cases for DomainClassifier class."""
 
-    def test_classify_finance_with_percentage(self):
+    def test_classify_finance_with_percentage(self, domain_classifier):
         """Test classification of finance domain with percentage."""
-        classifier = DomainClassifier()
         text = "Stock rose 10% today"
         claim = Claim(
             raw=text,
@@ -87,46 +84,41 @@ class TestDomainClassifier:
             date_hint="today",
             event_type="price_movement",
         )
-        result = classifier.classify(text, claim)
+        result = domain_classifier.classify(text, claim)
         assert result.domain == "finance"
         assert 0.0 <= result.confidence <= 1.0
 
-    def test_classify_finance_with_keyword(self):
+    def test_classify_finance_with_keyword(self, domain_classifier):
         """Test classification of finance domain with keyword."""
-        classifier = DomainClassifier()
         text = "Stock price jumped significantly"
-        result = classifier.classify(text)
+        result = domain_classifier.classify(text)
         assert result.domain == "finance"
         assert 0.0 <= result.confidence <= 1.0
 
-    def test_classify_tech_release(self):
+    def test_classify_tech_release(self, domain_classifier):
         """Test classification of tech release domain."""
-        classifier = DomainClassifier()
         text = "Apple announced a new product"
-        result = classifier.classify(text)
+        result = domain_classifier.classify(text)
         assert result.domain == "tech_release"
         assert 0.0 <= result.confidence <= 1.0
 
-    def test_classify_general_no_llm(self):
+    def test_classify_general_no_llm(self, domain_classifier):
         """Test classification defaults to general when semantic match is weak."""
-        classifier = DomainClassifier()
         text = "The weather is nice today"
-        result = classifier.classify(text)
+        result = domain_classifier.classify(text)
         assert result.domain == "general"
         assert 0.0 <= result.confidence <= 1.0
 
-    def test_classify_finance_multiple_keywords(self):
+    def test_classify_finance_multiple_keywords(self, domain_classifier):
         """Test classification with multiple finance keywords."""
-        classifier = DomainClassifier()
         text = "The stock surged and jumped today"
-        result = classifier.classify(text)
+        result = domain_classifier.classify(text)
         assert result.domain == "finance"
 
-    def test_classify_tech_multiple_keywords(self):
+    def test_classify_tech_multiple_keywords(self, domain_classifier):
         """Test classification with multiple tech keywords."""
-        classifier = DomainClassifier()
         text = "Company released and launched new software"
-        result = classifier.classify(text)
+        result = domain_classifier.classify(text)
         assert result.domain == "tech_release"
 
     def test_classify_function_finance(self):
@@ -157,16 +149,23 @@ class TestDomainClassifier:
         result = classify_domain(text)
         assert result.domain == "general"
 
-    def test_confidence_range(self):
+    def test_classify_function_caches_repeated_text(self):
+        """Test that classify_domain reuses the cached result for identical text."""
+        text = "NVDA plunged after the earnings call"
+        first = classify_domain(text)
+        hits_before = _classify_cached.cache_info().hits
+        second = classify_domain(text)
+        assert _classify_cached.cache_info().hits == hits_before + 1
+        assert first == second
+
+    def test_confidence_range(self, domain_classifier):
         """Test that confidence values are within valid range."""
-        classifier = DomainClassifier()
         text = "Stock fell dramatically"
-        result = classifier.classify(text)
+        result = domain_classifier.classify(text)
         assert 0.0 <= result.confidence <= 1.0
 
-    def test_classify_with_claim_object(self):
+    def test_classify_with_claim_object(self, domain_classifier):
         """Test classification using Claim object with extracted data."""
-        classifier = DomainClassifier()
         text = "Stock movement today"
         claim = Claim(
             raw=text,
@@ -176,12 +175,19 @@ class TestDomainClassifier:
             date_hint="today",
             event_type="price_movement",
         )
-        result = classifier.classify(text, claim)
+        result = domain_classifier.classify(text, claim)
         assert result.domain == "finance"
 
-    def test_case_insensitive_classification(self):
+    def test_classifiers_share_semantic_model(self):
+        """Test that DomainClassifier instances reuse one fitted semantic model."""
+        first = DomainClassifier()
+        second = DomainClassifier()
+        first.classify("Stock rose today")
+        assert first._semantic_classifier is second._semantic_classifier
+        assert second._semantic_classifier._vectorizer is not None
+
+    def test_case_insensitive_classification(self, domain_classifier):
         """Test that classification is case-insensitive."""
-        classifier = DomainClassifier()
         text = "STOCK PRICE ROSE TODAY"
-        result = classifier.classify(text)
+        result = domain_classifier.classify(text)
         assert result.domain == "finance"
@@ -2,19 +2,48 @@
 Tests for Finance Oracle.
 """
 
-import json
-from datetime import datetime, timedelta
-
+import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
 import pytest
+from pyarrow import csv as pacsv
 
 from server.oracles.finance import FinanceOracle
+from server.oracles.finance.migrate import convert_price_csv_to_parquet
+from server.oracles.finance.oracle import (
+    _VERDICT_LABELS,
+    PriceSeries,
+    _FileCache,
+    _news_cache,
+    _price_cache,
+)
 from server.schemas.claim import Claim, DomainResult
 
+# Relative date hints resolve against the New York calendar day
+NY_TZ = ZoneInfo("America/New_York")
+
+# Domain results are frozen, so one instance is shared by every test that needs it
+FINANCE_DOMAIN = DomainResult(domain="finance", confidence=0.9)
+CONFIDENT_FINANCE_DOMAIN = DomainResult(domain="finance", confidence=0.95)
+
+
+@pytest.fixture(scope="module")
+def oracle():
+    """Finance oracle shared by the module; tests monkeypatch its data directories."""
+    return FinanceOracle()
+
 
 @pytest.fixture
-def temp_data_dirs(tmp_path):
-    """Create temporary data directories with sample data."""
+def empty_data_dirs(tmp_path):
+    """Create this test's own data directories, initially empty."""
     price_dir = tmp_path / "data" / "prices"
     news_dir = tmp_path / "data" / "news"
     price_dir.mkdir(parents=True)
@@ -22,43 +51,36 @@ def temp_data_dirs(tmp_path):
     return {"price": price_dir, "news": news_dir}
 
 
-@pytest.fixture
-def sample_price_data(temp_data_dirs):
-    """Create sample price data for testing."""
-    # Create a realistic price dataset
-    base_time = datetime(2024, 1, 15, 9, 0, 0)
-    timestamps = []
-    prices = []
-    volumes = []
-
-    # Generate data for 8 days
-    for day_offset in range(8):
-        for minute_offset in range(0, 390, 5):  # Market hours: 9:00 AM - 4:00 PM
-            current_time = base_time + timedelta(days=day_offset, minutes=minute_offset)
-            timestamps.append(current_time.isoformat())
-
-            # Simulate price movement with a spike on day 7 at 9:30 AM
-            base_price = 100.0
-            if day_offset == 7 and minute_offset >= 30:
-                # 8% jump after event
-                prices.append(base_price * 1.08 + (minute_offset - 30) * 0.01)
-                volumes.append(1000000 + minute_offset * 10000)  # Higher volume
-            else:
-                prices.append(base_price + minute_offset * 0.01)
-                volumes.append(100000 + minute_offset * 100)  # Normal volume
-
-    df = pd.DataFrame({"timestamp": timestamps, "price": prices, "volume": volumes})
-
-    # Save to CSV
-    csv_path = temp_data_dirs["price"] / "SOL.csv"
-    df.to_csv(csv_path, index=False)
+@pytest.fixture(scope="session")
+def populated_data_dirs(tmp_path_factory):
+    """Create data directories with sample price and news data, shared by the session."""
+    # Written once per session; tests using these directories must not modify them
+    root = tmp_path_factory.mktemp("finance")
+    price_dir = root / "data" / "prices"
+    news_dir = root / "data" / "news"
+    price_dir.mkdir(parents=True)
+    news_dir.mkdir(parents=True)
 
-    return csv_path
+    # Create a realistic price dataset: 8 days of 5-minute bars over market hours
+    # (9:00 AM - 4:00 PM)
+    day_offset = np.repeat(np.arange(8), 78)
+    minute_offset = np.tile(np.arange(0, 390, 5), 8)
+    timestamps = (
+        pd.Timestamp(2024, 1, 15, 9)
+        + pd.to_timedelta(day_offset, unit="D")
+        + pd.to_timedelta(minute_offset, unit="min")
+    )
+
+    # Simulate price movement with an 8% jump and higher volume on day 7 from 9:30 AM
+    spike = (day_offset == 7) & (minute_offset >= 30)
+    prices = np.where(
+        spike, 100.0 * 1.08 + (minute_offset - 30) * 0.01, 100.0 + minute_offset * 0.01
+    )
+    volumes = np.where(spike, 1000000 + minute_offset * 10000, 100000 + minute_offset * 100)
 
+    df = pd.DataFrame({"timestamp": timestamps, "price": prices, "volume": volumes})
+    df.to_csv(price_dir / "SOL.csv", index=False)
 
-@pytest.fixture
-def sample_news_data(temp_data_dirs):
-    """Create sample news data for testing."""
     event_time = datetime(2024, 1, 22, 9, 30, 0)  # Day 7, 9:30 AM
 
     news_items = [
@@ -86,28 +108,55 @@ def sample_news_data(temp_data_dirs):
         },
     ]
 
-    # Save to JSON in news directory
-    json_path = temp_data_dirs["news"] / "SOL_news.json"
-    with open(json_path, "w") as f:
-        json.dump(news_items, f)
+    (news_dir / "SOL_news.json").write_bytes(orjson.dumps(news_items))
 
-    return json_path
+    return {"price": price_dir, "news": news_dir}
+
+
+@pytest.fixture
+def sample_price_data(empty_data_dirs, populated_data_dirs):
+    """Copy the sample price data into this test's own data directory."""
+    csv_path = empty_data_dirs["price"] / "SOL.csv"
+    shutil.copyfile(populated_data_dirs["price"] / "SOL.csv", csv_path)
+    return csv_path
+
+
+def _check_market_open(timestamp):
+    """Check that a timestamp is 9:30 AM ET in UTC (13:30 in EDT, 14:30 in EST)."""
+    assert timestamp.hour in [13, 14]
+    assert timestamp.minute == 30
+
+
+def _check_yesterday(timestamp):
+    """Check that a timestamp falls on yesterday's date in New York."""
+    now_ny = datetime.now(NY_TZ)
+    expected_day = (now_ny - timedelta(days=1)).day
+    # Convert timestamp to NY time to check day
+    timestamp_ny = timestamp.astimezone(NY_TZ)
+    assert timestamp_ny.day == expected_day
 
 
 class TestFinanceOracle:
     """Tests for FinanceOracle class."""
 
-    def test_oracle_name(self):
+    @pytest.fixture(autouse=True)
+    def _patch_dirs(self, oracle, empty_data_dirs, monkeypatch):
+        """Point the shared oracle at this test's own data directories."""
+        monkeypatch.setattr(oracle, "price_data_dir", empty_data_dirs["price"])
+        monkeypatch.setattr(oracle, "news_data_dir", empty_data_dirs["news"])
+
+    @pytest.fixture
+    def populated_data(self, oracle, populated_data_dirs, monkeypatch, _patch_dirs):
+        """Point the shared oracle at the read-only session sample data instead."""
+        monkeypatch.setattr(oracle, "price_data_dir", populated_data_dirs["price"])
+        monkeypatch.setattr(oracle, "news_data_dir", populated_data_dirs["news"])
+
+    def test_oracle_name(self, oracle):
         """Test that oracle has correct name."""
-        oracle = FinanceOracle()
         assert oracle.name == "finance"
 
-    def test_analyze_no_ticker(self, temp_data_dirs, monkeypatch):
+    def test_analyze_no_ticker(self, oracle):
         """Test oracle returns unsupported when no ticker is present."""
-        oracle = FinanceOracle()
-        monkeypatch.setattr(oracle, "price_data_dir", temp_data_dirs["price"])
-        monkeypatch.setattr(oracle, "news_data_dir", temp_data_dirs["news"])
-
         claim = Claim(
             raw="The market went up today",
             tickers=[],
@@ -116,7 +165,7 @@ class TestFinanceOracle:
             date_hint="today",
             event_type="price_movement",
         )
-        domain = DomainResult(domain="finance", confidence=0.9)
+        domain = FINANCE_DOMAIN
 
         result = oracle.analyze(claim, domain)
 
@@ -125,12 +174,8 @@ class TestFinanceOracle:
         assert result.confidence == 0.0
         assert "No ticker identified" in result.domain_context["reason"]
 
-    def test_analyze_no_price_data(self, temp_data_dirs, monkeypatch):
+    def test_analyze_no_price_data(self, oracle):
         """Test oracle returns unsupported when price data is missing."""
-        oracle = FinanceOracle()
-        monkeypatch.setattr(oracle, "price_data_dir", temp_data_dirs["price"])
-        monkeypatch.setattr(oracle, "news_data_dir", temp_data_dirs["news"])
-
         claim = Claim(
             raw="AAPL rose 10% today",
             tickers=["AAPL"],
@@ -139,7 +184,7 @@ class TestFinanceOracle:
             date_hint="today",
             event_type="price_movement",
         )
-        domain = DomainResult(domain="finance", confidence=0.9)
+        domain = FINANCE_DOMAIN
 
         result = oracle.analyze(claim, domain)
 
@@ -147,14 +192,8 @@ class TestFinanceOracle:
         assert result.verdict == "unsupported"
         assert "No cached price data" in result.domain_context["reason"]
 
-    def test_analyze_with_price_spike(
-        self, temp_data_dirs, sample_price_data, sample_news_data, monkeypatch
-    ):
+    def test_analyze_with_price_spike(self, oracle, populated_data):
         """Test oracle correctly identifies price spike after event."""
-        oracle = FinanceOracle()
-        monkeypatch.setattr(oracle, "price_data_dir", temp_data_dirs["price"])
-        monkeypatch.setattr(oracle, "news_data_dir", temp_data_dirs["news"])
-
         # Use claim without date_hint so it falls back to news timestamp
         # Note: percentages is empty to avoid percentage mismatch logic
         claim = Claim(
@@ -165,7 +204,7 @@ class TestFinanceOracle:
             date_hint=None,  # Will use news timestamp instead
             event_type="price_movement",
         )
-        domain = DomainResult(domain="finance", confidence=0.95)
+        domain = CONFIDENT_FINANCE_DOMAIN
 
         result = oracle.analyze(claim, domain)
 
@@ -191,12 +230,68 @@ class TestFinanceOracle:
             assert "post_event_return" in result.domain_context
             assert "abnormal_volume_z" in result.domain_context
 
-    def test_analyze_uncertain_without_event(self, temp_data_dirs, sample_price_data, monkeypatch):
-        """Test oracle returns uncertain when no event timestamp can be found."""
-        oracle = FinanceOracle()
-        monkeypatch.setattr(oracle, "price_data_dir", temp_data_dirs["price"])
-        monkeypatch.setattr(oracle, "news_data_dir", temp_data_dirs["news"])
+    def test_analyze_batch_matches_analyze(self, oracle, populated_data):
+        """Test that batch analysis returns the same results as analyzing claims one by one."""
+        domain = CONFIDENT_FINANCE_DOMAIN
+        claims = [
+            Claim(raw="SOL jumped after ETF approval", tickers=["SOL"]),
+            Claim(raw="Stocks rose", tickers=[]),
+            Claim(raw="SOL jumped 30%", tickers=["SOL"], percentages=[30.0]),
+            Claim(raw="XYZ fell", tickers=["XYZ"]),
+            Claim(raw="SOL jumped 8% after ETF approval", tickers=["SOL"], percentages=[8.0]),
+        ]
+        pairs = [(claim, domain) for claim in claims]
+
+        results = oracle.analyze_batch(pairs)
+
+        assert [result.model_dump() for result in results] == [
+            oracle.analyze(claim, domain).model_dump() for claim, domain in pairs
+        ]
+        assert results[1].verdict == "unsupported"
+        assert results[3].domain_context["reason"] == "No cached price data for XYZ"
+
+    def test_analyze_with_missing_volume(
+        self, oracle, empty_data_dirs, populated_data_dirs, sample_price_data
+    ):
+        """Test that one blank volume cell does not zero the abnormal volume z-score."""
+        shutil.copyfile(
+            populated_data_dirs["news"] / "SOL_news.json", empty_data_dirs["news"] / "SOL_news.json"
+        )
+        claim = Claim(raw="SOL jumped after ETF approval", tickers=["SOL"])
+        expected = oracle.analyze(claim, CONFIDENT_FINANCE_DOMAIN)
 
+        # Blank the volume of the first bar, far from the event window
+        df = pd.read_csv(sample_price_data)
+        df["volume"] = df["volume"].astype(float)
+        df.loc[0, "volume"] = np.nan
+        df.to_csv(sample_price_data, index=False)
+
+        result = oracle.analyze(claim, CONFIDENT_FINANCE_DOMAIN)
+
+        assert expected.domain_context["abnormal_volume_z"] != 0.0
+        assert result.domain_context["abnormal_volume_z"] == pytest.approx(
+            expected.domain_context["abnormal_volume_z"], rel=0.05
+        )
+
+    def test_analyze_concurrent_matches_sequential(self, oracle, populated_data):
+        """Test that threads sharing the file caches get the same result as one caller."""
+        claim = Claim(raw="SOL jumped after ETF approval", tickers=["SOL"])
+        expected = oracle.analyze(claim, CONFIDENT_FINANCE_DOMAIN)
+
+        def analyze(i):
+            # Drop the cached files now and then so loads race with hits
+            if i % 8 == 0:
+                _price_cache.clear()
+                _news_cache.clear()
+            return oracle.analyze(claim, CONFIDENT_FINANCE_DOMAIN)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(analyze, range(64)))
+
+        assert all(result == expected for result in results)
+
+    def test_analyze_uncertain_without_event(self, oracle, sample_price_data):
+        """Test oracle returns uncertain when no event timestamp can be found."""
         claim = Claim(
             raw="SOL jumped 8%",
             tickers=["SOL"],
@@ -205,7 +300,7 @@ class TestFinanceOracle:
             date_hint=None,  # No date hint
             event_type="price_movement",
         )
-        domain = DomainResult(domain="finance", confidence=0.9)
+        domain = FINANCE_DOMAIN
 
         result = oracle.analyze(claim, domain)
 
@@ -214,12 +309,8 @@ class TestFinanceOracle:
         assert result.confidence == 0.3
         assert "Could not identify event timestamp" in result.domain_context["reason"]
 
-    def test_load_price_data_success(self, temp_data_dirs, sample_price_data, monkeypatch):
+    def test_load_price_data_success(self, oracle, populated_data):
         """Test successful loading of price data."""
-        oracle = FinanceOracle()
-        monkeypatch.setattr(oracle, "price_data_dir", temp_data_dirs["price"])
-        monkeypatch.setattr(oracle, "news_data_dir", temp_data_dirs["news"])
-
         df = oracle._load_price_data("SOL")
 
         assert df is not None
@@ -228,22 +319,14 @@ class TestFinanceOracle:
         assert "volume" in df.columns
         assert len(df) > 0
 
-    def test_load_price_data_missing_file(self, temp_data_dirs, monkeypatch):
+    def test_load_price_data_missing_file(self, oracle):
         """Test loading price data when file doesn't exist."""
-        oracle = FinanceOracle()
-        monkeypatch.setattr(oracle, "price_data_dir", temp_data_dirs["price"])
-        monkeypatch.setattr(oracle, "news_data_dir", temp_data_dirs["news"])
-
         df = oracle._load_price_data("NONEXISTENT")
 
         assert df is None
 
-    def test_load_news_data_success(self, temp_data_dirs, sample_news_data, monkeypatch):
+    def test_load_news_data_success(self, oracle, populated_data):
         """Test successful loading of news data."""
-        oracle = FinanceOracle()
-        monkeypatch.setattr(oracle, "price_data_dir", temp_data_dirs["price"])
-        monkeypatch.setattr(oracle, "news_data_dir", temp_data_dirs["news"])
-
         news = oracle._load_news_data("SOL")
 
         assert news is not None
@@ -251,35 +334,57 @@ class TestFinanceOracle:
         assert len(news) == 2
         assert news[0]["title"] == "SOL ETF Approved by SEC"
 
-    def test_load_news_data_missing_file(self, temp_data_dirs, monkeypatch):
-        """Test loading news data when file doesn't exist."""
-        oracle = FinanceOracle()
-        monkeypatch.setattr(oracle, "price_data_dir", temp_data_dirs["price"])
-        monkeypatch.setattr(oracle, "news_data_dir", temp_data_dirs["news"])
+    def test_load_news_data_parses_timestamps(self, oracle, populated_data):
+        """Test that news timestamps and search text are prepared once at load."""
+        news = oracle._load_news_data("SOL")
 
+        assert news[0]["_ts"] == datetime(2024, 1, 22, 9, 30, tzinfo=timezone.utc)
+        assert news[1]["_ts"] == datetime(2024, 1, 22, 9, 45, tzinfo=timezone.utc)
+        assert news[0]["_title_lower"] == news[0]["title"].lower()
+        assert news[0]["_content_lower"] == news[0]["content"].lower()
+        assert news[0]["_body"] == news[0]["content"]
+
+    def test_indexed_news_matches_item_scan(self, oracle, empty_data_dirs):
+        """Test that vectorized news scoring picks the same item as scanning the list."""
+        news_items = [
+            {"title": "Markets open flat", "timestamp": "2024-01-15T09:30:00"},
+            {"title": "Apple earnings", "timestamp": "not a date", "content": "AAPL beat"},
+            {"title": "AAPL rallies", "timestamp": "2024-01-15T11:00:00"},
+            {"title": "Apple and AAPL news", "timestamp": "2024-01-15T12:00:00"},
+            {"title": "No timestamp for AAPL or Apple"},
+        ]
+        (empty_data_dirs["news"] / "AAPL_news.json").write_bytes(orjson.dumps(news_items))
+
+        news = oracle._load_news_data("AAPL")
+        assert news.search_index is not None
+
+        for companies in ([], ["Apple"]):
+            claim = Claim(raw="AAPL moved", tickers=["AAPL"], companies=companies)
+            indexed = oracle._extract_event_timestamp(claim, news, None)
+            scanned = oracle._extract_event_timestamp(claim, list(news), None)
+            assert indexed == scanned
+        assert indexed == datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+    def test_load_news_data_missing_file(self, oracle):
+        """Test loading news data when file doesn't exist."""
         news = oracle._load_news_data("NONEXISTENT")
 
         assert news is None
 
-    def test_load_price_data_ohlc_schema(self, temp_data_dirs, monkeypatch):
+    def test_load_price_data_ohlc_schema(self, oracle, empty_data_dirs):
         """Test loading price data with OHLC schema."""
-        oracle = FinanceOracle()
-        monkeypatch.setattr(oracle, "price_data_dir", temp_data_dirs["price"])
-        monkeypatch.setattr(oracle, "news_data_dir", temp_data_dirs["news"])
-
         # Create OHLC format CSV
-        base_time = datetime(2024, 1, 15, 9, 0, 0)
+        i = np.arange(10)
         data = {
-            "timestamp": [base_time + timedelta(minutes=i * 5) for i in range(10)],
-            "open": [100 + i * 0.5 for i in range(10)],
-            "high": [101 + i * 0.5 for i in range(10)],
-            "low": [99 + i * 0.5 for i in range(10)],
-            "close": [100.5 + i * 0.5 for i in range(10)],
-            "volume": [100000 + i * 1000 for i in range(10)],
+            "timestamp": np.datetime64("2024-01-15T09:00:00") + i * np.timedelta64(300, "s"),
+            "open": 100 + i * 0.5,
+            "high": 101 + i * 0.5,
+            "low": 99 + i * 0.5,
+            "close": 100.5 + i * 0.5,
+            "volume": 100000 + i * 1000,
         }
-        df = pd.DataFrame(data)
-        csv_path = temp_data_dirs["price"] / "OHLC_TEST.csv"
-        df.to_csv(csv_path, index=False)
+        csv_path = empty_data_dirs["price"] / "OHLC_TEST.csv"
+        pacsv.write_csv(pa.table(data), csv_path)
 
         # Load and verify
         loaded_df = oracle._load_price_data("OHLC_TEST")
@@ -292,58 +397,109 @@ class TestFinanceOracle:
         # Verify price is derived from close
         assert loaded_df["price"].iloc[0] == 100.5
 
-    def test_extract_event_timestamp_from_date_hint(self):
-        """Test event timestamp extraction from date hints."""
-        oracle = FinanceOracle()
+    def test_load_price_data_keeps_full_price_precision(self, oracle, empty_data_dirs):
+        """Test that CSV prices load as float64 while volumes are narrowed."""
+        i = np.arange(4)
+        data = {
+            "timestamp": np.datetime64("2024-01-15T09:00:00") + i * np.timedelta64(300, "s"),
+            "price": 123456.78 + i * 0.01,
+            "volume": 1000 + i,
+        }
+        pacsv.write_csv(pa.table(data), empty_data_dirs["price"] / "BIG.csv")
 
-        # Test "today" - should be 9:30 AM ET converted to UTC (13:30 or 14:30 depending on DST)
-        claim = Claim(
-            raw="AAPL rose", tickers=["AAPL"], companies=[], percentages=[], date_hint="today"
-        )
-        timestamp = oracle._extract_event_timestamp(claim, None, None)
-        assert timestamp is not None
-        # Hour should be 13 (EDT) or 14 (EST) depending on time of year
-        assert timestamp.hour in [13, 14]
-        assert timestamp.minute == 30
+        loaded_df = oracle._load_price_data("BIG")
 
-        # Test "yesterday"
-        claim = Claim(
-            raw="AAPL rose",
-            tickers=["AAPL"],
-            companies=[],
-            percentages=[],
-            date_hint="yesterday",
-        )
-        timestamp = oracle._extract_event_timestamp(claim, None, None)
-        assert timestamp is not None
-        # Use NY timezone to properly check day
-        from zoneinfo import ZoneInfo
+        assert loaded_df["price"].dtype == np.float64
+        assert loaded_df["price"].tolist() == data["price"].tolist()
+        assert loaded_df["volume"].dtype.itemsize < 8
+
+    def test_load_price_data_prefers_parquet(self, oracle, empty_data_dirs, sample_price_data):
+        """Test that a migrated Parquet file is loaded with the same contents as the CSV."""
+        csv_df = oracle._load_price_data("SOL")
+        parquet_path = convert_price_csv_to_parquet(sample_price_data)
+        assert parquet_path == empty_data_dirs["price"] / "SOL.parquet"
+
+        # Remove the CSV so the data can only come from Parquet
+        sample_price_data.unlink()
+        parquet_df = oracle._load_price_data("SOL")
+
+        assert parquet_df is not None
+        assert list(parquet_df.columns) == ["timestamp", "price", "volume"]
+        pd.testing.assert_frame_equal(parquet_df, csv_df, check_dtype=False)
+
+    def test_load_price_data_skips_stale_parquet(self, oracle, sample_price_data):
+        """Test that a CSV refreshed after migration wins over the older Parquet file."""
+        parquet_path = convert_price_csv_to_parquet(sample_price_data)
+        migrated_rows = len(oracle._load_price_data("SOL"))
 
-        ny_tz = ZoneInfo("America/New_York")
-        now_ny = datetime.now(ny_tz)
-        expected_day = (now_ny - timedelta(days=1)).day
-        # Convert timestamp to NY time to check day
-        timestamp_ny = timestamp.astimezone(ny_tz)
-        assert timestamp_ny.day == expected_day
+        # Refresh the CSV with fewer rows and a newer mtime than the Parquet file
+        df = pd.read_csv(sample_price_data)
+        df.head(10).to_csv(sample_price_data, index=False)
+        stat = parquet_path.stat()
+        os.utime(sample_price_data, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
 
-        # Test "this morning"
+        loaded_df = oracle._load_price_data("SOL")
+
+        assert migrated_rows > 10
+        assert len(loaded_df) == 10
+
+    def test_load_price_data_corrupt_parquet_falls_back(self, oracle, sample_price_data):
+        """Test that an unreadable Parquet file falls back to the CSV next to it."""
+        csv_df = oracle._load_price_data("SOL")
+        parquet_path = sample_price_data.with_suffix(".parquet")
+        parquet_path.write_bytes(b"not a parquet file")
+        stat = sample_price_data.stat()
+        os.utime(parquet_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        loaded_df = oracle._load_price_data("SOL")
+
+        assert loaded_df is not None
+        pd.testing.assert_frame_equal(loaded_df, csv_df)
+
+    def test_load_price_data_parquet_missing_column(self, oracle, empty_data_dirs):
+        """Test that a Parquet file without a required column is rejected."""
+        df = pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2024-01-15 09:30", periods=3, freq="5min", tz="UTC"),
+                "price": [100.0, 101.0, 102.0],
+            }
+        )
+        df.to_parquet(empty_data_dirs["price"] / "NOVOL.parquet", index=False)
+
+        assert oracle._load_price_data("NOVOL") is None
+
+    def test_load_price_data_cached_until_file_changes(self, oracle, sample_price_data):
+        """Test that repeat loads reuse the parsed DataFrame until the file is modified."""
+        first = oracle._load_price_data("SOL")
+        assert oracle._load_price_data("SOL") is first
+
+        # Bump the mtime so the cache entry is stale
+        stat = sample_price_data.stat()
+        os.utime(sample_price_data, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = oracle._load_price_data("SOL")
+        assert reloaded is not first
+        pd.testing.assert_frame_equal(reloaded, first)
+
+    @pytest.mark.parametrize(
+        "date_hint, check",
+        [
+            ("today", _check_market_open),
+            ("yesterday", _check_yesterday),
+            ("this morning", _check_market_open),
+        ],
+    )
+    def test_extract_event_timestamp_from_date_hint(self, oracle, date_hint, check):
+        """Test event timestamp extraction from date hints."""
         claim = Claim(
-            raw="AAPL rose",
-            tickers=["AAPL"],
-            companies=[],
-            percentages=[],
-            date_hint="this morning",
+            raw="AAPL rose", tickers=["AAPL"], companies=[], percentages=[], date_hint=date_hint
         )
         timestamp = oracle._extract_event_timestamp(claim, None, None)
         assert timestamp is not None
-        # Hour should be 13 (EDT) or 14 (EST) depending on time of year
-        assert timestamp.hour in [13, 14]
-        assert timestamp.minute == 30
+        check(timestamp)
 
-    def test_extract_event_timestamp_from_news(self):
+    def test_extract_event_timestamp_from_news(self, oracle):
         """Test event timestamp extraction from news data."""
-        oracle = FinanceOracle()
-
         claim = Claim(
             raw="AAPL rose", tickers=["AAPL"], companies=[], percentages=[], date_hint=None
         )
@@ -355,77 +511,101 @@ class TestFinanceOracle:
         assert timestamp.hour == 10
         assert timestamp.minute == 0
 
-    def test_classify_claim_likely_true(self):
-        """Test claim classification as likely_true."""
-        oracle = FinanceOracle()
-
-        metrics = {
-            "pre_event_return": 0.5,  # Small pre-event return
-            "post_event_return": 8.0,  # Large post-event return
-            "abnormal_volume_z": 3.0,  # High abnormal volume
-        }
-
-        verdict, confidence = oracle._classify_claim(metrics)
-
-        assert verdict == "likely_true"
-        # With /100 formula: max(8.0, 7.5) / 100 = 0.08, clamped to 0.1, + 0.1 volume = 0.2
-        assert confidence >= 0.1
-        assert confidence <= 0.95
-
-    def test_classify_claim_likely_false(self):
-        """Test claim classification as likely_false."""
-        oracle = FinanceOracle()
-
-        metrics = {
-            "pre_event_return": 8.0,  # Large pre-event return
-            "post_event_return": 0.5,  # Small post-event return
-            "abnormal_volume_z": 1.0,
-        }
-
-        verdict, confidence = oracle._classify_claim(metrics)
-
-        assert verdict == "likely_false"
-        # With /100 formula: max(8.0, 7.5) / 100 = 0.08, clamped to 0.1, + 0.1 volume = 0.2
-        assert confidence >= 0.1
-        assert confidence <= 0.95
+    def test_snap_to_nearest_bar(self, oracle):
+        """Test that timestamps snap forward to the next bar, or to the last bar."""
+        series = PriceSeries.from_frame(
+            pd.DataFrame(
+                {
+                    "timestamp": pd.date_range(
+                        "2024-01-15 09:30", periods=3, freq="5min", tz="UTC"
+                    ),
+                    "price": [100.0, 101.0, 102.0],
+                    "volume": [1000, 2000, 3000],
+                }
+            )
+        )
 
-    def test_classify_claim_uncertain(self):
-        """Test claim classification as uncertain."""
-        oracle = FinanceOracle()
+        on_bar = oracle._snap_to_nearest_bar(
+            datetime(2024, 1, 15, 9, 35, tzinfo=timezone.utc), series
+        )
+        assert on_bar == datetime(2024, 1, 15, 9, 35, tzinfo=timezone.utc)
 
-        metrics = {
-            "pre_event_return": -2.0,  # Negative pre-event return
-            "post_event_return": -1.0,  # Negative post-event return
-            "abnormal_volume_z": 0.5,
-        }
+        between = oracle._snap_to_nearest_bar(
+            datetime(2024, 1, 15, 9, 31, tzinfo=timezone.utc), series
+        )
+        assert between == datetime(2024, 1, 15, 9, 35, tzinfo=timezone.utc)
 
+        after_last = oracle._snap_to_nearest_bar(
+            datetime(2024, 1, 16, 9, 0, tzinfo=timezone.utc), series
+        )
+        assert after_last == datetime(2024, 1, 15, 9, 40, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize(
+        "metrics, expected_verdict, expected_confidence",
+        [
+            pytest.param(
+                # Small pre-event return, large post-event return, high abnormal volume
+                {"pre_event_return": 0.5, "post_event_return": 8.0, "abnormal_volume_z": 3.0},
+                "likely_true",
+                (0.1, 0.95),
+                id="likely_true",
+            ),
+            pytest.param(
+                # Large pre-event return, small post-event return
+                {"pre_event_return": 8.0, "post_event_return": 0.5, "abnormal_volume_z": 1.0},
+                "likely_false",
+                (0.1, 0.95),
+                id="likely_false",
+            ),
+            pytest.param(
+                # Negative pre- and post-event returns
+                {"pre_event_return": -2.0, "post_event_return": -1.0, "abnormal_volume_z": 0.5},
+                "uncertain",
+                (0.4, 0.4),
+                id="uncertain",
+            ),
+            pytest.param(
+                # Claim said 12% but actual is 2%: likely_false even though post > pre
+                {
+                    "pre_event_return": 0.5,
+                    "post_event_return": 2.0,
+                    "abnormal_volume_z": 1.5,
+                    "percentage_mismatch": True,
+                },
+                "likely_false",
+                (0.1, 0.95),
+                id="percentage_mismatch",
+            ),
+        ],
+    )
+    def test_classify_claim(self, oracle, metrics, expected_verdict, expected_confidence):
+        """Test claim classification from event metrics."""
         verdict, confidence = oracle._classify_claim(metrics)
 
-        assert verdict == "uncertain"
-        assert confidence == 0.4
-
-    def test_classify_claim_percentage_mismatch(self):
-        """Test that percentage mismatch causes likely_false verdict."""
-        oracle = FinanceOracle()
-
-        metrics = {
-            "pre_event_return": 0.5,
-            "post_event_return": 2.0,  # Actual is 2%
-            "abnormal_volume_z": 1.5,
-            "percentage_mismatch": True,  # Claim said 12% but actual is 2%
-        }
-
-        verdict, confidence = oracle._classify_claim(metrics)
+        assert verdict == expected_verdict
+        low, high = expected_confidence
+        assert low <= confidence <= high
+
+    def test_classify_claim_vec(self, oracle):
+        """Test classifying several claims in one vectorized call."""
+        verdict_codes, confidences = oracle._classify_claim_vec(
+            np.array([0.5, 3.0, 0.0, 0.5]),  # pre-event returns
+            np.array([8.0, -2.0, 0.0, 8.0]),  # post-event returns
+            np.array([2.0, 0.0, 0.0, 0.0]),  # abnormal volume z-scores
+            np.array([False, False, False, True]),  # percentage mismatch
+        )
 
-        # Should be likely_false due to mismatch, even though post > pre
-        assert verdict == "likely_false"
-        assert confidence >= 0.1
-        assert confidence <= 0.95
+        assert [_VERDICT_LABELS[code] for code in verdict_codes] == [
+            "likely_true",
+            "likely_false",
+            "uncertain",
+            "likely_false",
+        ]
+        # Confidences clamp to 0.1, plus 0.1 for abnormal volume; uncertain is 0.4
+        assert confidences.tolist() == pytest.approx([0.2, 0.1, 0.4, 0.1])
 
-    def test_build_evidence_items(self):
+    def test_build_evidence_items(self, oracle):
         """Test building evidence items from news data."""
-        oracle = FinanceOracle()
-
         news_data = [
             {
                 "title": "News Item 1",
@@ -455,10 +635,24 @@ class TestFinanceOracle:
         assert evidence[1].title == "News Item 2"
         assert len(evidence[1].extract) <= 200
 
-    def test_build_evidence_items_limit(self):
-        """Test that evidence items are limited to 5."""
-        oracle = FinanceOracle()
+    def test_build_evidence_items_stance_by_verdict(self, oracle):
+        """Test that evidence stance follows the verdict."""
+        news_data = [{"title": "News", "timestamp": "2024-01-15T10:00:00"}]
+
+        stances = {
+            verdict: (item.stance, item.stance_conf)
+            for verdict in ("likely_true", "likely_false", "uncertain")
+            for item in oracle._build_evidence_items(news_data, "AAPL", verdict)
+        }
 
+        assert stances == {
+            "likely_true": ("supports", 0.6),
+            "likely_false": ("unrelated", 0.5),
+            "uncertain": ("unrelated", 0.3),
+        }
+
+    def test_build_evidence_items_limit(self, oracle):
+        """Test that evidence items are limited to 5."""
         news_data = [
             {
                 "title": f"News Item {i}",
@@ -473,12 +667,143 @@ class TestFinanceOracle:
 
         assert len(evidence) == 5  # Should limit to 5 items
 
-    def test_build_evidence_items_empty(self):
+    def test_build_evidence_items_empty(self, oracle):
         """Test building evidence items with no news data."""
-        oracle = FinanceOracle()
-
         evidence = oracle._build_evidence_items(None, "AAPL", "uncertain")
-        assert evidence == []
+        assert len(evidence) == 0
 
         evidence = oracle._build_evidence_items([], "AAPL", "uncertain")
-        assert evidence == []
+        assert len(evidence) == 0
+
+
+class TestPriceSeries:
+    """Test cases for PriceSeries."""
+
+    def test_volume_stats_match_numpy(self):
+        """Test that prefix-sum volume statistics match a direct computation."""
+        volumes = [100000, 250000, 175000, 90000, 300000, 120000, 80000]
+        frame = pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2024-01-15 09:30", periods=7, freq="5min", tz="UTC"),
+                "price": [100.0] * 7,
+                "volume": volumes,
+            }
+        )
+        series = PriceSeries.from_frame(frame)
+
+        for lo, hi in [(0, 7), (1, 4), (2, 7), (5, 7)]:
+            window = np.array(volumes[lo:hi], dtype=float)
+            mean, std = series.volume_stats(lo, hi)
+            assert mean == pytest.approx(window.mean())
+            assert std == pytest.approx(window.std(ddof=1))
+
+    def test_volume_stats_constant_window(self):
+        """Test that a window of identical volumes has exactly zero spread."""
+        frame = pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2024-01-15 09:30", periods=6, freq="5min", tz="UTC"),
+                "price": [100.0] * 6,
+                "volume": [987654321, 5000, 5000, 5000, 5000, 123],
+            }
+        )
+        series = PriceSeries.from_frame(frame)
+
+        mean, std = series.volume_stats(1, 5)
+        assert mean == pytest.approx(5000)
+        assert std == 0.0
+
+    def test_volume_stats_mixed_scale(self):
+        """Test that a quiet window after much larger volumes keeps its true spread."""
+        rng = np.random.default_rng(7)
+        volumes = np.concatenate(
+            (rng.integers(900_000_000, 1_100_000_000, 200_000), 5000 + np.arange(20) % 3)
+        )
+        frame = pd.DataFrame(
+            {
+                "timestamp": pd.date_range(
+                    "2024-01-01", periods=len(volumes), freq="1min", tz="UTC"
+                ),
+                "price": 100.0,
+                "volume": volumes,
+            }
+        )
+        series = PriceSeries.from_frame(frame)
+
+        lo = np.array([len(volumes) - 20, 0])
+        hi = np.array([len(volumes), 1000])
+        mean, std = series.volume_stats(lo, hi)
+        for k in range(2):
+            window = volumes[lo[k] : hi[k]].astype(float)
+            assert mean[k] == pytest.approx(window.mean())
+            assert std[k] == pytest.approx(window.std(ddof=1))
+
+    def test_volume_stats_skip_missing_volumes(self):
+        """Test that a missing volume is skipped like pandas mean() and std() skip NaN."""
+        volumes = pd.Series([100000, 250000, np.nan, 90000, 300000, 120000, 80000])
+        frame = pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2024-01-15 09:30", periods=7, freq="5min", tz="UTC"),
+                "price": [100.0] * 7,
+                "volume": volumes,
+            }
+        )
+        series = PriceSeries.from_frame(frame)
+
+        for lo, hi in [(0, 7), (1, 4), (2, 7), (4, 7)]:
+            window = volumes[lo:hi]
+            mean, std = series.volume_stats(lo, hi)
+            assert mean == pytest.approx(window.mean())
+            assert std == pytest.approx(window.std())
+            assert series.volume_mean(np.array([lo]), np.array([hi]))[0] == pytest.approx(
+                window.mean()
+            )
+
+    def test_arrays_are_read_only(self):
+        """Test that cached series arrays cannot be modified in place."""
+        frame = pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2024-01-15 09:30", periods=3, freq="5min", tz="UTC"),
+                "price": [100.0, 101.0, 102.0],
+                "volume": [1000, 2000, 3000],
+            }
+        )
+        series = PriceSeries.from_frame(frame)
+
+        with pytest.raises(ValueError):
+            series.prices[0] = 0.0
+        with pytest.raises(ValueError):
+            series.volume_cumsum[0] = 1.0
+        assert frame["price"].iloc[0] == 100.0
+
+
+class TestFileCache:
+    """Test cases for the parsed data file cache."""
+
+    def test_concurrent_get_with_eviction(self, tmp_path):
+        """Test that threads hitting and evicting entries at once never see a KeyError."""
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"file{i}.txt"
+            path.write_text(str(i))
+            paths.append(path)
+
+        # Far fewer slots than files, so almost every get evicts another thread's entry
+        cache = _FileCache(maxsize=2)
+
+        def read_all(offset):
+            return [
+                cache.get(paths[(offset + j) % len(paths)], lambda path: path.read_text())
+                for j in range(500)
+            ]
+
+        # Switch threads as often as possible so lookups and evictions interleave
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(read_all, range(8)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        for offset, values in enumerate(results):
+            assert values == [str((offset + j) % len(paths)) for j in range(500)]
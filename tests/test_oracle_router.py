@@ -2,120 +2,120 @@
 Tests for enhanced oracle router with fallback logic.
 """
 
+import pytest
+from pydantic import ValidationError
 
-from server.oracles.router import OracleRouter
+from server.oracles.router import OracleRouter, get_oracle_router
 from server.schemas.claim import Claim, DomainResult
+from server.schemas.oracle_result import OracleRoutingDecision
 
+# Claims are frozen, so rows can share one instance
+AAPL_MAYBE_MOVED = Claim(raw="AAPL might have moved", tickers=["AAPL"])
 
-class TestOracleRouter:
-    """Test cases for oracle routing logic."""
-
-    def test_route_to_finance_oracle_high_confidence(self):
-        """Test routing to finance oracle with high confidence."""
-        router = OracleRouter()
-        claim = Claim(
-            raw="AAPL rose 10% today",
-            tickers=["AAPL"],
-            percentages=[10.0],
-            date_hint="today",
-        )
-        domain = DomainResult(domain="finance", confidence=0.9)
-
-        results, routing = router.run(claim, domain)
-
-        # Should route to finance oracle only (no fallback due to high confidence)
-        assert routing.primary_oracle == "finance"
-        assert routing.fallback_used is False
-        assert len(results) == 1
-        assert results[0].oracle_name == "finance"
-
-    def test_route_to_tech_release_oracle(self):
-        """Test routing to tech release oracle."""
-        router = OracleRouter()
-        claim = Claim(
-            raw="Apple announced new iPhone",
-            companies=["Apple"],
-            event_type="tech_release",
-        )
-        domain = DomainResult(domain="tech_release", confidence=0.85)
-
-        results, routing = router.run(claim, domain)
-
-        assert routing.primary_oracle == "tech_release"
-        # Tech release oracle stub returns "uncertain", so fallback should be used
-        assert routing.fallback_used is True
-        assert len(results) == 2  # Primary + fallback
-        assert results[0].oracle_name == "tech_release"
-        assert results[1].oracle_name == "llm_oracle"
-
-    def test_route_to_general_llm_oracle(self):
-        """Test routing to general LLM oracle."""
-        router = OracleRouter()
-        claim = Claim(raw="This is a general statement")
-        domain = DomainResult(domain="general", confidence=0.8)
-
-        results, routing = router.run(claim, domain)
 
-        assert routing.primary_oracle == "general"
-        assert routing.fallback_used is False
-        assert len(results) == 1
-        assert results[0].oracle_name == "llm_oracle"
+@pytest.fixture(scope="module")
+def router():
+    """Oracle router shared by the module."""
+    return OracleRouter()
 
-    def test_fallback_on_low_confidence(self):
-        """Test that LLM oracle is used as fallback when domain confidence < 0.6."""
-        router = OracleRouter()
-        claim = Claim(
-            raw="AAPL might have moved",
-            tickers=["AAPL"],
-        )
-        domain = DomainResult(domain="finance", confidence=0.5)
-
-        results, routing = router.run(claim, domain)
-
-        # Should use fallback due to low confidence
-        assert routing.primary_oracle == "finance"
-        assert routing.fallback_used is True
-        assert len(results) == 2
-        assert results[0].oracle_name == "finance"
-        assert results[1].oracle_name == "llm_oracle"
-
-    def test_fallback_on_uncertain_verdict(self):
-        """Test that LLM oracle is used as fallback when primary oracle returns uncertain."""
-        router = OracleRouter()
-        # Tech release oracle stub always returns uncertain
-        claim = Claim(
-            raw="Apple announced something",
-            companies=["Apple"],
-        )
-        domain = DomainResult(domain="tech_release", confidence=0.9)
 
-        results, routing = router.run(claim, domain)
-
-        # Should use fallback because tech_release oracle returns uncertain
-        assert routing.primary_oracle == "tech_release"
-        assert routing.fallback_used is True
-        assert len(results) == 2
-        assert results[0].oracle_name == "tech_release"
-        assert results[0].verdict == "uncertain"
-        assert results[1].oracle_name == "llm_oracle"
-
-    def test_no_fallback_for_general_domain(self):
-        """Test that general domain doesn't trigger fallback to itself."""
-        router = OracleRouter()
-        claim = Claim(raw="Random statement")
-        domain = DomainResult(domain="general", confidence=0.3)
+class TestOracleRouter:
+    """Test cases for oracle routing logic."""
 
+    @pytest.mark.parametrize(
+        "claim, domain, expected",
+        [
+            pytest.param(
+                Claim(
+                    raw="AAPL rose 10% today",
+                    tickers=["AAPL"],
+                    percentages=[10.0],
+                    date_hint="today",
+                ),
+                DomainResult(domain="finance", confidence=0.9),
+                # No fallback due to high confidence
+                {"primary": "finance", "fallback": False, "oracle_names": ["finance"]},
+                id="finance-high-conf",
+            ),
+            pytest.param(
+                Claim(
+                    raw="Apple announced new iPhone",
+                    companies=["Apple"],
+                    event_type="tech_release",
+                ),
+                DomainResult(domain="tech_release", confidence=0.85),
+                # Tech release oracle stub returns "uncertain", so fallback should be used
+                {
+                    "primary": "tech_release",
+                    "fallback": True,
+                    "oracle_names": ["tech_release", "llm_oracle"],
+                },
+                id="tech-release",
+            ),
+            pytest.param(
+                Claim(raw="This is a general statement"),
+                DomainResult(domain="general", confidence=0.8),
+                {"primary": "general", "fallback": False, "oracle_names": ["llm_oracle"]},
+                id="general",
+            ),
+            pytest.param(
+                AAPL_MAYBE_MOVED,
+                DomainResult(domain="finance", confidence=0.5),
+                # LLM oracle is used as fallback when domain confidence < 0.6
+                {
+                    "primary": "finance",
+                    "fallback": True,
+                    "oracle_names": ["finance", "llm_oracle"],
+                },
+                id="fallback-low-conf",
+            ),
+            pytest.param(
+                Claim(raw="Apple announced something", companies=["Apple"]),
+                DomainResult(domain="tech_release", confidence=0.9),
+                # LLM oracle is used as fallback when the primary oracle returns uncertain
+                {
+                    "primary": "tech_release",
+                    "fallback": True,
+                    "oracle_names": ["tech_release", "llm_oracle"],
+                    "primary_verdict": "uncertain",
+                },
+                id="fallback-uncertain-verdict",
+            ),
+            pytest.param(
+                Claim(raw="Random statement"),
+                DomainResult(domain="general", confidence=0.3),
+                # Low confidence but primary is already LLM, no fallback to itself
+                {"primary": "general", "fallback": False, "oracle_names": ["llm_oracle"]},
+                id="general-no-fallback",
+            ),
+            pytest.param(
+                AAPL_MAYBE_MOVED,
+                DomainResult(domain="finance", confidence=0.2),
+                # Domain confidence < 0.3 routes straight to the LLM oracle
+                {"primary": "general", "fallback": False, "oracle_names": ["llm_oracle"]},
+                id="very-low-conf-skips-primary",
+            ),
+            pytest.param(
+                Claim(raw="Some claim"),
+                DomainResult(domain="unknown_domain", confidence=0.8),
+                # Unknown domains route to the general (LLM) oracle
+                {"primary": "general", "fallback": False, "oracle_names": ["llm_oracle"]},
+                id="unknown-domain",
+            ),
+        ],
+    )
+    def test_routing(self, router, claim, domain, expected):
+        """Test primary oracle, fallback use and oracles called for each routing case."""
         results, routing = router.run(claim, domain)
 
-        # Low confidence but primary is already LLM, no fallback
-        assert routing.primary_oracle == "general"
-        assert routing.fallback_used is False
-        assert len(results) == 1
-        assert results[0].oracle_name == "llm_oracle"
+        assert routing.primary_oracle == expected["primary"]
+        assert routing.fallback_used is expected["fallback"]
+        assert [result.oracle_name for result in results] == expected["oracle_names"]
+        if "primary_verdict" in expected:
+            assert results[0].verdict == expected["primary_verdict"]
 
-    def test_confidence_threshold_boundary(self):
+    def test_confidence_threshold_boundary(self, router):
         """Test behavior at confidence threshold boundary (0.6)."""
-        router = OracleRouter()
         claim = Claim(raw="Test claim", tickers=["AAPL"])
 
         # At threshold (0.6), should NOT use fallback
@@ -130,23 +130,8 @@ class TestOracleRouter:
         assert routing.fallback_used is True
         assert len(results) == 2
 
-    def test_unknown_domain_routes_to_general(self):
-        """Test that unknown domains route to general (LLM) oracle."""
-        router = OracleRouter()
-        claim = Claim(raw="Some claim")
-        # Use an unknown domain (should fall back to general)
-        domain = DomainResult(domain="unknown_domain", confidence=0.8)
-
-        results, routing = router.run(claim, domain)
-
-        assert routing.primary_oracle == "general"
-        assert len(results) == 1
-        assert results[0].oracle_name == "llm_oracle"
-
-    def test_oracle_registry_contains_all_domains(self):
+    def test_oracle_registry_contains_all_domains(self, router):
         """Test that oracle registry has entries for all expected domains."""
-        router = OracleRouter()
-
         assert "finance" in router.registry
         assert "tech_release" in router.registry
         assert "general" in router.registry
@@ -155,3 +140,21 @@ class TestOracleRouter:
         assert router.registry["finance"].name == "finance"
         assert router.registry["tech_release"].name == "tech_release"
         assert router.registry["general"].name == "llm_oracle"
+
+    def test_get_oracle_router_is_shared(self):
+        """Test that the API endpoints share one process-wide router."""
+        assert get_oracle_router() is get_oracle_router()
+
+    def test_routing_decisions_are_shared(self, router):
+        """Test that identical routing outcomes reuse one decision object."""
+        domain = DomainResult(domain="general", confidence=0.8)
+
+        _, first = router.run(Claim(raw="First general statement"), domain)
+        _, second = router.run(Claim(raw="Second general statement"), domain)
+
+        assert first is second
+        assert first == OracleRoutingDecision(primary_oracle="general", fallback_used=False)
+
+        # Shared decisions are frozen, so no caller can change them for everyone else
+        with pytest.raises(ValidationError):
+            first.fallback_used = True
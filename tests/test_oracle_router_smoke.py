@@ -2,182 +2,131 @@
 Smoke tests for oracle router endpoint.
 """
 
-from fastapi.testclient import TestClient
+import orjson
+import pytest
+from pydantic import ValidationError
 
-from server.main import app
+from server.routers.oracles import run_oracles
 from server.schemas.claim import Claim, DomainResult
-
-client = TestClient(app)
+from server.schemas.oracle_result import RunOraclesRequest
+
+# Request payloads are built and dumped once; tests only reference the dicts
+FINANCE_CLAIM = Claim(
+    raw="AAPL rose 10% today",
+    tickers=["AAPL"],
+    companies=[],
+    percentages=[10.0],
+    date_hint="today",
+    event_type="price_movement",
+).model_dump()
+TECH_CLAIM = Claim(
+    raw="Apple announced a new iPhone yesterday",
+    tickers=[],
+    companies=["Apple"],
+    percentages=[],
+    date_hint="yesterday",
+    event_type="tech_release",
+).model_dump()
+GENERAL_CLAIM = Claim(
+    raw="This is a general statement",
+    tickers=[],
+    companies=[],
+    percentages=[],
+    date_hint=None,
+    event_type=None,
+).model_dump()
+BARE_CLAIM = Claim(
+    raw="Test claim",
+    tickers=[],
+    companies=[],
+    percentages=[],
+    date_hint=None,
+    event_type=None,
+).model_dump()
+
+FINANCE_DOMAIN_HIGH = DomainResult(domain="finance", confidence=0.9).model_dump()
+FINANCE_DOMAIN_MID = DomainResult(domain="finance", confidence=0.7).model_dump()
+TECH_DOMAIN_LOW = DomainResult(domain="tech_release", confidence=0.5).model_dump()
+GENERAL_DOMAIN = DomainResult(domain="general", confidence=0.8).model_dump()
+
+
+def _assert_envelope(data):
+    """Assert that a /check_claim/oracles response has the expected structure."""
+    assert "results" in data
+    assert "routing" in data
+
+    assert isinstance(data["results"], list)
+    assert len(data["results"]) >= 1  # At least one oracle result
+    for result in data["results"]:
+        assert "oracle_name" in result
+        assert "verdict" in result
+        assert "confidence" in result
+        assert "evidence" in result
+        assert "domain_context" in result
+
+    routing = data["routing"]
+    assert "primary_oracle" in routing
+    assert "fallback_used" in routing
 
 
 class TestOracleRouterSmoke:
     """Smoke tests for /check_claim/oracles endpoint."""
 
-    def test_run_oracles_finance_high_confidence(self):
-        """Test oracle routing for finance domain with high confidence."""
-        # Build test claim and domain
-        claim = Claim(
-            raw="AAPL rose 10% today",
-            tickers=["AAPL"],
-            companies=[],
-            percentages=[10.0],
-            date_hint="today",
-            event_type="price_movement",
-        )
-        domain = DomainResult(domain="finance", confidence=0.9)
-
-        # Make request
-        response = client.post(
-            "/check_claim/oracles",
-            json={"claim": claim.model_dump(), "domain": domain.model_dump()},
-        )
-
-        # Assert response
-        assert response.status_code == 200
-        data = response.json()
-
-        # Check structure
-        assert "results" in data
-        assert "routing" in data
-
-        # Check results
-        results = data["results"]
-        assert isinstance(results, list)
-        assert len(results) >= 1  # At least one oracle result
-
-        # Check first result
-        first_result = results[0]
-        assert "oracle_name" in first_result
-        assert "verdict" in first_result
-        assert "confidence" in first_result
-        assert "evidence" in first_result
-        assert first_result["verdict"] == "unsupported"  # NullOracle returns unsupported
-
-        # Check routing
-        routing = data["routing"]
-        assert "primary_oracle" in routing
-        assert "fallback_used" in routing
-        assert routing["primary_oracle"] == "finance"
-        assert routing["fallback_used"] is False  # High confidence, no fallback
-
-    def test_run_oracles_tech_low_confidence(self):
-        """Test oracle routing for tech_release domain with low confidence."""
-        # Build test claim and domain
-        claim = Claim(
-            raw="Apple announced a new iPhone yesterday",
-            tickers=[],
-            companies=["Apple"],
-            percentages=[],
-            date_hint="yesterday",
-            event_type="tech_release",
-        )
-        domain = DomainResult(domain="tech_release", confidence=0.5)
-
-        # Make request
-        response = client.post(
-            "/check_claim/oracles",
-            json={"claim": claim.model_dump(), "domain": domain.model_dump()},
-        )
-
-        # Assert response
-        assert response.status_code == 200
-        data = response.json()
-
-        # Check results - should have primary + fallback
-        results = data["results"]
-        assert len(results) == 2  # Primary + fallback due to low confidence
-
-        # Check routing
-        routing = data["routing"]
-        assert routing["primary_oracle"] == "tech_release"
-        assert routing["fallback_used"] is True  # Low confidence triggers fallback
-
-    def test_run_oracles_general_domain(self):
-        """Test oracle routing for general domain."""
-        # Build test claim and domain
-        claim = Claim(
-            raw="This is a general statement",
-            tickers=[],
-            companies=[],
-            percentages=[],
-            date_hint=None,
-            event_type=None,
-        )
-        domain = DomainResult(domain="general", confidence=0.8)
-
-        # Make request
-        response = client.post(
-            "/check_claim/oracles",
-            json={"claim": claim.model_dump(), "domain": domain.model_dump()},
-        )
-
-        # Assert response
-        assert response.status_code == 200
-        data = response.json()
-
-        # Check routing - should route to general (LLM oracle) for general domain
-        routing = data["routing"]
-        assert routing["primary_oracle"] == "general"
-        assert routing["fallback_used"] is False  # High confidence, no additional fallback
+    @pytest.mark.parametrize(
+        "claim, domain, expected_routing, expected_verdicts",
+        [
+            # High confidence, no fallback; no cached price data for AAPL
+            (
+                FINANCE_CLAIM,
+                FINANCE_DOMAIN_HIGH,
+                {"primary_oracle": "finance", "fallback_used": False},
+                ["unsupported"],
+            ),
+            # Low confidence triggers fallback: primary + fallback results
+            (
+                TECH_CLAIM,
+                TECH_DOMAIN_LOW,
+                {"primary_oracle": "tech_release", "fallback_used": True},
+                ["uncertain", "uncertain"],
+            ),
+            # General domain routes to the LLM oracle, no additional fallback
+            (
+                GENERAL_CLAIM,
+                GENERAL_DOMAIN,
+                {"primary_oracle": "general", "fallback_used": False},
+                ["uncertain"],
+            ),
+        ],
+    )
+    async def test_run_oracles_routing(self, claim, domain, expected_routing, expected_verdicts):
+        """Test oracle routing and results for each domain."""
+        # Call the handler directly; the HTTP wiring is covered by the structure test
+        request = RunOraclesRequest.model_validate({"claim": claim, "domain": domain})
+
+        response = await run_oracles(request)
+
+        assert [result.verdict for result in response.results] == expected_verdicts
+        assert response.routing.model_dump() == expected_routing
 
     def test_run_oracles_missing_claim(self):
-        """Test that missing claim returns error."""
-        domain = DomainResult(domain="finance", confidence=0.9)
-
-        response = client.post("/check_claim/oracles", json={"domain": domain.model_dump()})
-
-        # Should return validation error
-        assert response.status_code == 422
+        """Test that a request without a claim fails validation."""
+        # FastAPI turns this ValidationError into a 422 response
+        with pytest.raises(ValidationError):
+            RunOraclesRequest.model_validate({"domain": FINANCE_DOMAIN_HIGH})
 
     def test_run_oracles_missing_domain(self):
-        """Test that missing domain returns error."""
-        claim = Claim(
-            raw="AAPL rose 10% today",
-            tickers=["AAPL"],
-            companies=[],
-            percentages=[10.0],
-            date_hint="today",
-            event_type="price_movement",
-        )
-
-        response = client.post("/check_claim/oracles", json={"claim": claim.model_dump()})
+        """Test that a request without a domain fails validation."""
+        with pytest.raises(ValidationError):
+            RunOraclesRequest.model_validate({"claim": FINANCE_CLAIM})
 
-        # Should return validation error
-        assert response.status_code == 422
-
-    def test_run_oracles_response_structure(self):
+    async def test_run_oracles_response_structure(self, async_client):
         """Test that response has correct structure."""
-        claim = Claim(
-            raw="Test claim",
-            tickers=[],
-            companies=[],
-            percentages=[],
-            date_hint=None,
-            event_type=None,
-        )
-        domain = DomainResult(domain="finance", confidence=0.7)
-
-        response = client.post(
+        response = await async_client.post(
             "/check_claim/oracles",
-            json={"claim": claim.model_dump(), "domain": domain.model_dump()},
+            json={"claim": BARE_CLAIM, "domain": FINANCE_DOMAIN_MID},
         )
 
         assert response.status_code == 200
-        data = response.json()
-
-        # Check top-level structure
-        assert "results" in data
-        assert "routing" in data
-
-        # Check result structure
-        for result in data["results"]:
-            assert "oracle_name" in result
-            assert "verdict" in result
-            assert "confidence" in result
-            assert "evidence" in result
-            assert "domain_context" in result
-
-        # Check routing structure
-        routing = data["routing"]
-        assert "primary_oracle" in routing
-        assert "fallback_used" in routing
+        data = orjson.loads(response.content)
+        _assert_envelope(data)
+        assert data["routing"] == {"primary_oracle": "finance", "fallback_used": False}